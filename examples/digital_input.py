@@ -22,26 +22,48 @@ Pin reference for Orin Nano:
 import time
 import sys
 import os
+import select
+from collections import deque
 
 # Add the src directory to the path to import our library
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from stickbot import DigitalPin, setup_gpio, cleanup_gpio, read_pin_state
+from stickbot import DigitalPin, PinBank, setup_gpio, cleanup_gpio, read_pin_state
+
+# Resolve the GPIO backend once at module scope instead of repeating the
+# try/except import dance inside every example function
+try:
+    import Jetson.GPIO as GPIO
+except ImportError:
+    import RPi.GPIO as GPIO
+
+# Optional libgpiod backend for the event-driven monitoring path
+try:
+    import gpiod
+except ImportError:
+    gpiod = None
 
 # Configuration
 BUTTON_PIN = 16   # BOARD pin 16 for button input
 LED_PIN = 18      # BOARD pin 18 for LED output
 
+# BOARD pin -> libgpiod line offset. Offsets are SoC specific (check
+# /sys/kernel/debug/gpio on your board); fill this in to enable the
+# epoll-driven monitoring path in pin_monitoring_example.
+GPIOD_OFFSETS = {}
+
+
+def _flush_events(events):
+    """Emit buffered state-change messages with a single stdout write"""
+    if events:
+        sys.stdout.write("\n".join(msg for _, msg in events) + "\n")
+        events.clear()
+
 
 def basic_input_example():
     """Basic GPIO input reading"""
     print("=== Basic Input Example ===")
-    
-    try:
-        import Jetson.GPIO as GPIO
-    except ImportError:
-        import RPi.GPIO as GPIO
-    
+
     # Setup
     GPIO.setmode(GPIO.BOARD)
     GPIO.setup(BUTTON_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)  # Pull-up for button
@@ -50,31 +72,38 @@ def basic_input_example():
     print("Press and release the button to see state changes")
     print("(Button pressed = LOW, Button released = HIGH)")
     
-    start_time = time.time()
+    deadline = time.monotonic() + 10
     last_state = None
-    
-    while time.time() - start_time < 10:
+
+    # Buffer transition messages instead of printing inline: a tty write
+    # can stall the loop for milliseconds right when edges are bursting
+    events = deque(maxlen=10000)
+
+    while True:
+        # Block in the kernel until an edge arrives (or the deadline passes)
+        # instead of polling every 10 ms
+        remaining_ms = int((deadline - time.monotonic()) * 1000)
+        if remaining_ms <= 0:
+            break
+
+        channel = GPIO.wait_for_edge(BUTTON_PIN, GPIO.BOTH, timeout=remaining_ms)
+        if channel is None:
+            break  # Timed out with no edge
+
         current_state = GPIO.input(BUTTON_PIN)
-        
         if current_state != last_state:
             state_str = "LOW (PRESSED)" if current_state == GPIO.LOW else "HIGH (RELEASED)"
-            print(f"Pin {BUTTON_PIN} changed to: {state_str}")
+            events.append((time.perf_counter(), f"Pin {BUTTON_PIN} changed to: {state_str}"))
             last_state = current_state
-        
-        time.sleep(0.01)  # Small delay to avoid excessive CPU usage
-    
+
+    _flush_events(events)
     print("Basic input example completed\n")
 
 
 def wrapper_class_input_example():
     """Example using DigitalPin wrapper for input"""
     print("=== Wrapper Class Input Example ===")
-    
-    try:
-        import Jetson.GPIO as GPIO
-    except ImportError:
-        import RPi.GPIO as GPIO
-    
+
     # Create input pin (button) and output pin (LED)
     button = DigitalPin(BUTTON_PIN, GPIO.IN)
     led = DigitalPin(LED_PIN, GPIO.OUT, GPIO.LOW)
@@ -83,66 +112,77 @@ def wrapper_class_input_example():
     print(f"LED: {led}")
     print("\nPress button to control LED for 15 seconds...")
     
-    start_time = time.time()
+    deadline = time.monotonic() + 15
     last_button_state = None
-    
-    while time.time() - start_time < 15:
+    events = deque(maxlen=10000)
+
+    while True:
+        # Wait for an actual edge instead of sampling the pin every 10 ms
+        remaining_ms = int((deadline - time.monotonic()) * 1000)
+        if remaining_ms <= 0:
+            break
+
+        channel = GPIO.wait_for_edge(BUTTON_PIN, GPIO.BOTH, timeout=remaining_ms)
+        if channel is None:
+            break  # Timed out with no edge
+
         button_state = button.read()
-        
+
         # Button is pressed when it reads LOW (due to pull-up)
         if button_state == GPIO.LOW and last_button_state != GPIO.LOW:
-            print("Button PRESSED - LED ON")
+            events.append((time.perf_counter(), "Button PRESSED - LED ON"))
             led.set_high()
         elif button_state == GPIO.HIGH and last_button_state != GPIO.HIGH:
-            print("Button RELEASED - LED OFF")
+            events.append((time.perf_counter(), "Button RELEASED - LED OFF"))
             led.set_low()
-        
+
         last_button_state = button_state
-        time.sleep(0.01)
-    
+
     # Ensure LED is off
     led.set_low()
+    _flush_events(events)
     print("Wrapper class input example completed\n")
 
 
 def button_counter_example():
     """Count button presses"""
     print("=== Button Counter Example ===")
-    
-    try:
-        import Jetson.GPIO as GPIO
-    except ImportError:
-        import RPi.GPIO as GPIO
-    
+
     button = DigitalPin(BUTTON_PIN, GPIO.IN)
     led = DigitalPin(LED_PIN, GPIO.OUT, GPIO.LOW)
     
     print("Counting button presses for 20 seconds...")
     print("Each press will blink the LED")
     
+    # Falling edges (presses) are detected and debounced by the kernel-side
+    # event filter, so no Python-level debounce sleep is needed
+    GPIO.add_event_detect(BUTTON_PIN, GPIO.FALLING, bouncetime=150)
+
     press_count = 0
-    last_state = GPIO.HIGH  # Start assuming button is not pressed
-    start_time = time.time()
-    
-    while time.time() - start_time < 20:
-        current_state = button.read()
-        
-        # Detect falling edge (button press)
-        if last_state == GPIO.HIGH and current_state == GPIO.LOW:
+    led_off_at = None  # When to turn the acknowledgement blink back off
+    deadline = time.monotonic() + 20
+    events = deque(maxlen=10000)
+
+    while time.monotonic() < deadline:
+        if GPIO.event_detected(BUTTON_PIN):
             press_count += 1
-            print(f"Button press #{press_count}")
-            
-            # Blink LED to indicate button press
+            events.append((time.perf_counter(), f"Button press #{press_count}"))
+
+            # Blink LED without blocking: schedule the turn-off instead of
+            # sleeping through it, so presses during the blink still count
             led.set_high()
-            time.sleep(0.1)
+            led_off_at = time.perf_counter() + 0.1
+
+        if led_off_at is not None and time.perf_counter() >= led_off_at:
             led.set_low()
-            
-            # Debounce delay
-            time.sleep(0.1)
-        
-        last_state = current_state
-        time.sleep(0.01)
-    
+            led_off_at = None
+
+        time.sleep(0.05)
+
+    GPIO.remove_event_detect(BUTTON_PIN)
+    led.set_low()
+
+    _flush_events(events)
     print(f"Total button presses: {press_count}")
     print("Button counter example completed\n")
 
@@ -150,73 +190,83 @@ def button_counter_example():
 def interrupt_example():
     """Example using GPIO interrupts (event detection)"""
     print("=== Interrupt Example ===")
-    
-    try:
-        import Jetson.GPIO as GPIO
-    except ImportError:
-        import RPi.GPIO as GPIO
-    
-    # Global variables for interrupt callback
-    press_count = [0]  # Use list to make it mutable in callback
-    led = None
-    
-    def button_callback(channel):
-        """Callback function for button press interrupt"""
-        press_count[0] += 1
-        print(f"Interrupt! Button press #{press_count[0]} on pin {channel}")
-        if led:
-            # Quick LED flash
-            led.set_high()
-            time.sleep(0.05)
-            led.set_low()
-    
+
     # Setup pins
     GPIO.setmode(GPIO.BOARD)
     GPIO.setup(BUTTON_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
     led = DigitalPin(LED_PIN, GPIO.OUT, GPIO.LOW)
-    
-    # Setup interrupt on falling edge (button press)
-    GPIO.add_event_detect(BUTTON_PIN, GPIO.FALLING, callback=button_callback, bouncetime=200)
-    
-    print("Interrupt-based button detection active for 15 seconds...")
+
+    print("Edge-triggered button detection active for 15 seconds...")
     print("Press the button multiple times")
-    
+
+    # The main thread is otherwise idle, so rather than paying a callback
+    # dispatch on Jetson.GPIO's internal edge-detection thread per press
+    # (thread wakeup + GIL handoff per edge), block right here on the edge
+    press_count = 0
+    deadline = time.monotonic() + 15
+
     try:
-        # Just wait while interrupts handle button presses
-        time.sleep(15)
+        while True:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                break
+
+            channel = GPIO.wait_for_edge(
+                BUTTON_PIN, GPIO.FALLING, timeout=remaining_ms, bouncetime=200
+            )
+            if channel is None:
+                break  # Timed out with no edge
+
+            press_count += 1
+            print(f"Button press #{press_count} on pin {channel}")
+
+            # Quick LED flash
+            led.set_high()
+            time.sleep(0.05)
+            led.set_low()
     except KeyboardInterrupt:
         print("Interrupted by user")
-    
-    # Remove event detection
-    GPIO.remove_event_detect(BUTTON_PIN)
+
     led.set_low()
-    
-    print(f"Total interrupts detected: {press_count[0]}")
+
+    print(f"Total presses detected: {press_count}")
     print("Interrupt example completed\n")
 
 
 def analog_like_reading_example():
     """Simulate analog-like reading by sampling rapidly"""
     print("=== Rapid Sampling Example ===")
-    
-    try:
-        import Jetson.GPIO as GPIO
-    except ImportError:
-        import RPi.GPIO as GPIO
-    
+
     button = DigitalPin(BUTTON_PIN, GPIO.IN)
     
     print("Taking 1000 rapid samples to show pin state distribution...")
     print("Hold button pressed or released during sampling")
     
-    samples = []
+    # Accumulate a running count instead of storing 1000 samples and
+    # re-scanning the list twice afterwards
+    high_count = 0
+
+    # Pace against an absolute monotonic deadline: plain sleep(0.001)
+    # overshoots by 50-500 us per tick, so sleep most of the interval and
+    # spin out the last ~300 us to hold the 1 kHz cadence
+    # Bind hot names as locals: LOAD_FAST is ~2x cheaper than
+    # LOAD_GLOBAL + LOAD_ATTR, which matters at 1000 iterations/second
+    _read = button.read
+    _perf = time.perf_counter
+    _sleep = time.sleep
+
+    next_t = _perf()
     for i in range(1000):
-        samples.append(button.read())
-        time.sleep(0.001)  # 1ms between samples
-    
-    high_count = samples.count(GPIO.HIGH)
-    low_count = samples.count(GPIO.LOW)
-    
+        high_count += _read()
+        next_t += 0.001
+        remaining = next_t - _perf()
+        if remaining > 0.0005:
+            _sleep(remaining - 0.0003)
+        while _perf() < next_t:
+            pass
+
+    low_count = 1000 - high_count
+
     print(f"Sample results:")
     print(f"  HIGH samples: {high_count} ({high_count/10:.1f}%)")
     print(f"  LOW samples: {low_count} ({low_count/10:.1f}%)")
@@ -229,47 +279,107 @@ def analog_like_reading_example():
     print("Rapid sampling example completed\n")
 
 
+def _gpiod_pin_monitoring(input_pins, duration=10):
+    """
+    Event-driven pin monitoring on libgpiod line-event file descriptors
+
+    The thread sleeps in epoll and wakes only when the kernel delivers an
+    edge event, so idle monitoring costs zero syscalls and zero wakeups.
+    """
+    chip = gpiod.Chip('gpiochip0')
+    lines = {}
+    epoll = select.epoll()
+
+    for pin_num in input_pins:
+        line = chip.get_line(GPIOD_OFFSETS[pin_num])
+        line.request(consumer='stickbot', type=gpiod.LINE_REQ_EV_BOTH_EDGES)
+        fd = line.event_get_fd()
+        epoll.register(fd, select.EPOLLIN)
+        lines[fd] = (pin_num, line)
+        print(f"Monitoring pin {pin_num}")
+
+    print("Monitoring pins for 10 seconds...")
+    deadline = time.monotonic() + duration
+    events = deque(maxlen=10000)
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        for fd, _ in epoll.poll(timeout=remaining):
+            pin_num, line = lines[fd]
+            event = line.event_read()
+            state_str = "HIGH" if event.type == gpiod.LineEvent.RISING_EDGE else "LOW"
+            events.append((time.perf_counter(), f"Pin {pin_num}: {state_str}"))
+
+    for fd, (pin_num, line) in lines.items():
+        epoll.unregister(fd)
+        line.release()
+    epoll.close()
+
+    _flush_events(events)
+    print("Pin monitoring example completed\n")
+
+
 def pin_monitoring_example():
     """Monitor multiple input pins"""
     print("=== Pin Monitoring Example ===")
-    
-    try:
-        import Jetson.GPIO as GPIO
-    except ImportError:
-        import RPi.GPIO as GPIO
-    
+
     # Monitor multiple pins (adjust based on your hardware)
     input_pins = [BUTTON_PIN, 15]  # Add more pins if available
-    pins = []
-    
-    # Setup input pins
-    for pin_num in input_pins:
-        try:
-            pin = DigitalPin(pin_num, GPIO.IN)
-            pins.append((pin_num, pin))
-            print(f"Monitoring pin {pin_num}")
-        except Exception as e:
-            print(f"Could not setup pin {pin_num}: {e}")
-    
-    if not pins:
-        print("No pins available for monitoring")
+
+    # Prefer the epoll-driven libgpiod path when the line offsets are known:
+    # the loop body then runs only when a real edge occurs
+    if gpiod is not None and all(pin in GPIOD_OFFSETS for pin in input_pins):
+        _gpiod_pin_monitoring(input_pins)
         return
-    
+
+    # PinBank sets the numbering mode and configures the whole bank as
+    # inputs in one batched GPIO.setup, so there is no separate per-pin
+    # setup pass; construct it before registering edge detection
+    try:
+        bank = PinBank(input_pins, GPIO.IN)
+    except Exception as e:
+        print(f"Could not setup pins {input_pins}: {e}")
+        return
+
+    pins = bank.pins
+    for pin_num in pins:
+        print(f"Monitoring pin {pin_num}")
+
+    # Register kernel-side edge detection so we only touch pins that changed
+    for pin_num in pins:
+        GPIO.add_event_detect(pin_num, GPIO.BOTH, bouncetime=20)
+
     print("Monitoring pins for 10 seconds...")
-    last_states = {}
-    start_time = time.time()
-    
-    while time.time() - start_time < 10:
-        for pin_num, pin in pins:
-            current_state = pin.read()
-            
-            if pin_num not in last_states or last_states[pin_num] != current_state:
-                state_str = "HIGH" if current_state == GPIO.HIGH else "LOW"
-                print(f"Pin {pin_num}: {state_str}")
-                last_states[pin_num] = current_state
-        
-        time.sleep(0.01)
-    
+
+    # Bank state is packed into an integer bitmask (bit i = state of
+    # pins[i]); successive masks are XORed to find the changed pins
+    last_mask = bank.read_all()
+    start_time = time.monotonic()
+    events = deque(maxlen=10000)
+
+    while time.monotonic() - start_time < 10:
+        if any(GPIO.event_detected(pin_num) for pin_num in pins):
+            mask = bank.read_all()
+
+            # XOR against the previous sweep and report only changed bits
+            diff = mask ^ last_mask
+            while diff:
+                i = (diff & -diff).bit_length() - 1
+                diff &= diff - 1
+                state_str = "HIGH" if (mask >> i) & 1 else "LOW"
+                events.append((time.perf_counter(), f"Pin {pins[i]}: {state_str}"))
+
+            last_mask = mask
+
+        # Edges are latched by the kernel, so a slower sweep loses nothing
+        time.sleep(0.05)
+
+    for pin_num in pins:
+        GPIO.remove_event_detect(pin_num)
+
+    _flush_events(events)
     print("Pin monitoring example completed\n")
 
 
@@ -25,22 +25,34 @@ import os
 # Add the src directory to the path to import our library
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from stickbot import DigitalPin, setup_gpio, cleanup_gpio
+from stickbot import DigitalPin, PinBank, setup_gpio, cleanup_gpio
+
+# Resolve the GPIO backend once at module scope instead of repeating the
+# try/except import dance inside every example function
+try:
+    import Jetson.GPIO as GPIO
+except ImportError:
+    import RPi.GPIO as GPIO
 
 # Configuration
 LED_PIN = 18  # BOARD pin 18
 BLINK_DURATION = 0.5  # seconds
 
+# Morse SOS flattened to (level, seconds) pairs: the whole pattern is data
+# driven by one loop, and other letters can be added as tables later
+_SOS_PATTERN = tuple(
+    [(GPIO.HIGH, 0.2), (GPIO.LOW, 0.2)] * 3    # S (3 short)
+    + [(GPIO.LOW, 0.4)]                        # letter gap
+    + [(GPIO.HIGH, 0.6), (GPIO.LOW, 0.2)] * 3  # O (3 long)
+    + [(GPIO.LOW, 0.4)]                        # letter gap
+    + [(GPIO.HIGH, 0.2), (GPIO.LOW, 0.2)] * 3  # S (3 short)
+)
+
 
 def basic_output_example():
     """Basic GPIO output using Jetson.GPIO directly"""
     print("=== Basic Output Example ===")
-    
-    try:
-        import Jetson.GPIO as GPIO
-    except ImportError:
-        import RPi.GPIO as GPIO
-    
+
     # Setup
     GPIO.setmode(GPIO.BOARD)
     GPIO.setup(LED_PIN, GPIO.OUT, initial=GPIO.LOW)
@@ -59,12 +71,7 @@ def basic_output_example():
 def wrapper_class_example():
     """Example using the DigitalPin wrapper class"""
     print("=== Wrapper Class Example ===")
-    
-    try:
-        import Jetson.GPIO as GPIO
-    except ImportError:
-        import RPi.GPIO as GPIO
-    
+
     # Create a digital output pin
     led = DigitalPin(LED_PIN, GPIO.OUT, GPIO.LOW)
     print(f"Created: {led}")
@@ -79,11 +86,11 @@ def wrapper_class_example():
     led.set_low()
     time.sleep(1)
     
-    # Toggle several times
+    # Toggle several times. toggle() returns the freshly written level,
+    # so no extra lookup (let alone a hardware read) is needed to report it
     print("Toggling LED 5 times...")
     for i in range(5):
-        led.toggle()
-        state = "ON" if led.get_value() == GPIO.HIGH else "OFF"
+        state = "ON" if led.toggle() == GPIO.HIGH else "OFF"
         print(f"  Toggle {i+1}: LED is {state}")
         time.sleep(0.5)
     
@@ -95,21 +102,30 @@ def wrapper_class_example():
 def blinking_pattern_example():
     """More complex blinking patterns"""
     print("=== Blinking Patterns Example ===")
-    
-    try:
-        import Jetson.GPIO as GPIO
-    except ImportError:
-        import RPi.GPIO as GPIO
-    
+
     led = DigitalPin(LED_PIN, GPIO.OUT, GPIO.LOW)
     
-    # Pattern 1: Fast blinks
+    # Pattern 1: Fast blinks. A 5 Hz square wave at 50% duty is exactly a
+    # hardware PWM job - the PWM engine drives every edge with zero Python
+    # wakeups - so try that first and fall back to a deadline-paced toggle
+    # loop on pins without PWM support
     print("Pattern 1: Fast blinks (5 times)")
-    for i in range(5):
-        led.set_high()
-        time.sleep(0.1)
-        led.set_low()
-        time.sleep(0.1)
+    try:
+        pwm = GPIO.PWM(LED_PIN, 5.0)
+        pwm.start(50)
+        time.sleep(1.0)
+        pwm.stop()
+    except Exception:
+        # Absolute deadlines instead of back-to-back sleeps, so timing
+        # errors do not accumulate across edges
+        next_t = time.perf_counter()
+        for i in range(5):
+            led.set_high()
+            next_t += 0.1
+            time.sleep(max(0, next_t - time.perf_counter()))
+            led.set_low()
+            next_t += 0.1
+            time.sleep(max(0, next_t - time.perf_counter()))
     
     time.sleep(1)
     
@@ -123,79 +139,60 @@ def blinking_pattern_example():
     
     time.sleep(1)
     
-    # Pattern 3: Morse code SOS
+    # Pattern 3: Morse code SOS, driven from the precomputed table
     print("Pattern 3: Morse code SOS")
-    def short_blink():
-        led.set_high()
-        time.sleep(0.2)
-        led.set_low()
-        time.sleep(0.2)
-    
-    def long_blink():
-        led.set_high()
-        time.sleep(0.6)
-        led.set_low()
-        time.sleep(0.2)
-    
-    # S (3 short)
-    for _ in range(3):
-        short_blink()
-    time.sleep(0.4)
-    
-    # O (3 long)
-    for _ in range(3):
-        long_blink()
-    time.sleep(0.4)
-    
-    # S (3 short)
-    for _ in range(3):
-        short_blink()
-    
+    for level, duration in _SOS_PATTERN:
+        GPIO.output(LED_PIN, level)
+        time.sleep(duration)
+
     print("Blinking patterns example completed\n")
 
 
 def multiple_pins_example():
     """Control multiple output pins"""
     print("=== Multiple Pins Example ===")
-    
-    try:
-        import Jetson.GPIO as GPIO
-    except ImportError:
-        import RPi.GPIO as GPIO
-    
+
     # Use multiple pins (make sure these are available on your board)
     pins = [18, 16, 15]  # Adjust based on your hardware setup
-    leds = []
-    
-    # Create multiple LED objects
+    available = []
+
+    # Probe which pins can be configured on this board
+    GPIO.setmode(GPIO.BOARD)
     for pin in pins:
         try:
-            led = DigitalPin(pin, GPIO.OUT, GPIO.LOW)
-            leds.append(led)
+            GPIO.setup(pin, GPIO.OUT, initial=GPIO.LOW)
+            available.append(pin)
             print(f"Created LED on pin {pin}")
         except Exception as e:
             print(f"Could not setup pin {pin}: {e}")
-    
-    if not leds:
+
+    if not available:
         print("No LEDs available for multiple pin example")
         return
-    
-    # Light up LEDs in sequence
+
+    # One PinBank write updates the whole bank in a single batched call,
+    # instead of a Python-level set_high/set_low per LED
+    bank = PinBank(available, GPIO.OUT)
+
+    # Light up LEDs in sequence (bit i stays set once lit)
     print("Lighting LEDs in sequence...")
-    for i, led in enumerate(leds):
+    mask = 0
+    for i in range(len(bank)):
         print(f"  Lighting LED {i+1}")
-        led.set_high()
+        mask |= 1 << i
+        bank.write_all(mask)
         time.sleep(0.5)
-    
+
     time.sleep(1)
-    
+
     # Turn off LEDs in reverse order
     print("Turning off LEDs in reverse order...")
-    for i, led in enumerate(reversed(leds)):
-        print(f"  Turning off LED {len(leds)-i}")
-        led.set_low()
+    for i in reversed(range(len(bank))):
+        print(f"  Turning off LED {i+1}")
+        mask &= ~(1 << i)
+        bank.write_all(mask)
         time.sleep(0.5)
-    
+
     print("Multiple pins example completed\n")
 
 
@@ -9,185 +9,188 @@ The pinout follows the Raspberry Pi standard layout.
 Pin numbering uses BOARD mode (physical pin numbers 1-40).
 """
 
+import sys
+
+# All reference text is static, so it is composed once at import time and
+# emitted with a single sys.stdout.write per section instead of dozens of
+# line-buffered print calls (one write syscall each on a tty)
+
+_PINOUT = """NVIDIA Orin Nano - 40-Pin GPIO Header
+==================================================
+Pin numbering: BOARD mode (physical pins 1-40)
+Orientation: USB ports facing down
+
+    3.3V  (1) ● ● (2)  5V
+   GPIO2  (3) ● ● (4)  5V
+   GPIO3  (5) ● ● (6)  GND
+   GPIO4  (7) ● ● (8)  GPIO14
+     GND  (9) ● ● (10) GPIO15
+  GPIO17 (11) ● ● (12) GPIO18
+  GPIO27 (13) ● ● (14) GND
+  GPIO22 (15) ● ● (16) GPIO23
+    3.3V (17) ● ● (18) GPIO24
+  GPIO10 (19) ● ● (20) GND
+   GPIO9 (21) ● ● (22) GPIO25
+  GPIO11 (23) ● ● (24) GPIO8
+     GND (25) ● ● (26) GPIO7
+   GPIO0 (27) ● ● (28) GPIO1
+   GPIO5 (29) ● ● (30) GND
+   GPIO6 (31) ● ● (32) GPIO12
+  GPIO13 (33) ● ● (34) GND
+  GPIO19 (35) ● ● (36) GPIO16
+  GPIO26 (37) ● ● (38) GPIO20
+     GND (39) ● ● (40) GPIO21
+
+"""
+
+_GROUND_PINS = (6, 9, 14, 20, 25, 30, 34, 39)
+_GPIO_PINS = (7, 11, 12, 13, 15, 16, 18, 19, 21, 22, 23, 24, 26, 29, 31, 32, 33, 35, 36, 37, 38, 40)
+
+_PIN_FUNCTIONS = (
+    "Pin Function Reference (BOARD numbering)\n"
+    + "=" * 45 + "\n\n"
+    "POWER PINS:\n"
+    "-----------\n"
+    "Pin  1: 3.3V Power\n"
+    "Pin  2: 5V Power\n"
+    "Pin  4: 5V Power\n"
+    "Pin 17: 3.3V Power\n\n"
+    "GROUND PINS:\n"
+    "------------\n"
+    + "\n".join(f"Pin {pin:2d}: Ground (GND)" for pin in _GROUND_PINS) + "\n\n"
+    "GPIO PINS (Digital I/O):\n"
+    "-------------------------\n"
+    + "\n".join(f"Pin {pin:2d}: Digital I/O" for pin in _GPIO_PINS) + "\n\n"
+    "PWM-CAPABLE PINS:\n"
+    "-----------------\n"
+    "Pin 15: PWM capable (may need pinmux config)\n"
+    "Pin 33: PWM capable (may need pinmux config)\n\n"
+    "SPECIAL FUNCTION PINS:\n"
+    "----------------------\n"
+    "Pin  3: I2C1 SDA (GPIO2)\n"
+    "Pin  5: I2C1 SCL (GPIO3)\n"
+    "Pin  8: UART TX (GPIO14)\n"
+    "Pin 10: UART RX (GPIO15)\n"
+    "Pin 19: SPI MOSI (GPIO10)\n"
+    "Pin 21: SPI MISO (GPIO9)\n"
+    "Pin 23: SPI SCLK (GPIO11)\n"
+    "Pin 24: SPI CE0 (GPIO8)\n"
+    "Pin 26: SPI CE1 (GPIO7)\n\n"
+)
+
+_PINMUX_COMMANDS = (
+    "PWM Pinmux Configuration Commands\n"
+    + "=" * 35 + "\n"
+    "Some PWM pins may require hardware configuration:\n\n"
+    "Enable PWM on Pin 15:\n"
+    "sudo busybox devmem 0x02440020 32 0x400\n\n"
+    "Enable PWM on Pin 33:\n"
+    "sudo busybox devmem 0x02434040 32 0x401\n\n"
+    "Note: These commands are temporary (until reboot).\n"
+    "For permanent configuration, modify the device tree.\n\n"
+)
+
+_WIRING_EXAMPLES = (
+    "Common Wiring Examples\n"
+    + "=" * 22 + "\n\n"
+    "LED CONNECTION:\n"
+    "---------------\n"
+    "LED Anode (long leg) → GPIO Pin (e.g., Pin 18)\n"
+    "LED Cathode (short leg) → 330Ω Resistor → Ground (e.g., Pin 6)\n\n"
+    "BUTTON CONNECTION:\n"
+    "------------------\n"
+    "Button Terminal 1 → GPIO Pin (e.g., Pin 16)\n"
+    "Button Terminal 2 → Ground (e.g., Pin 6)\n"
+    "Note: Use internal pull-up in software\n\n"
+    "SERVO CONNECTION:\n"
+    "-----------------\n"
+    "Servo Red Wire → 5V (Pin 2 or Pin 4)\n"
+    "Servo Black/Brown Wire → Ground (e.g., Pin 6)\n"
+    "Servo Orange/Yellow Wire → PWM Pin (Pin 15 or Pin 33)\n\n"
+    "SENSOR CONNECTION (3.3V):\n"
+    "--------------------------\n"
+    "Sensor VCC → 3.3V (Pin 1 or Pin 17)\n"
+    "Sensor GND → Ground (e.g., Pin 6)\n"
+    "Sensor Signal → GPIO Pin (e.g., Pin 18)\n\n"
+)
+
+
 def print_gpio_pinout():
     """Print a visual diagram of the 40-pin GPIO header"""
-    print("NVIDIA Orin Nano - 40-Pin GPIO Header")
-    print("=" * 50)
-    print("Pin numbering: BOARD mode (physical pins 1-40)")
-    print("Orientation: USB ports facing down")
-    print()
-    
-    print("    3.3V  (1) ● ● (2)  5V")
-    print("   GPIO2  (3) ● ● (4)  5V")  
-    print("   GPIO3  (5) ● ● (6)  GND")
-    print("   GPIO4  (7) ● ● (8)  GPIO14")
-    print("     GND  (9) ● ● (10) GPIO15")
-    print("  GPIO17 (11) ● ● (12) GPIO18")
-    print("  GPIO27 (13) ● ● (14) GND")
-    print("  GPIO22 (15) ● ● (16) GPIO23")
-    print("    3.3V (17) ● ● (18) GPIO24")
-    print("  GPIO10 (19) ● ● (20) GND")
-    print("   GPIO9 (21) ● ● (22) GPIO25")
-    print("  GPIO11 (23) ● ● (24) GPIO8")
-    print("     GND (25) ● ● (26) GPIO7")
-    print("   GPIO0 (27) ● ● (28) GPIO1")
-    print("   GPIO5 (29) ● ● (30) GND")
-    print("   GPIO6 (31) ● ● (32) GPIO12")
-    print("  GPIO13 (33) ● ● (34) GND")
-    print("  GPIO19 (35) ● ● (36) GPIO16")
-    print("  GPIO26 (37) ● ● (38) GPIO20")
-    print("     GND (39) ● ● (40) GPIO21")
-    print()
+    sys.stdout.write(_PINOUT)
 
 
 def print_pin_functions():
     """Print detailed pin function information"""
-    print("Pin Function Reference (BOARD numbering)")
-    print("=" * 45)
-    print()
-    
-    print("POWER PINS:")
-    print("-----------")
-    print("Pin  1: 3.3V Power")
-    print("Pin  2: 5V Power") 
-    print("Pin  4: 5V Power")
-    print("Pin 17: 3.3V Power")
-    print()
-    
-    print("GROUND PINS:")
-    print("------------")
-    ground_pins = [6, 9, 14, 20, 25, 30, 34, 39]
-    for pin in ground_pins:
-        print(f"Pin {pin:2d}: Ground (GND)")
-    print()
-    
-    print("GPIO PINS (Digital I/O):")
-    print("-------------------------")
-    gpio_pins = [7, 11, 12, 13, 15, 16, 18, 19, 21, 22, 23, 24, 26, 29, 31, 32, 33, 35, 36, 37, 38, 40]
-    for pin in gpio_pins:
-        print(f"Pin {pin:2d}: Digital I/O")
-    print()
-    
-    print("PWM-CAPABLE PINS:")
-    print("-----------------")
-    print("Pin 15: PWM capable (may need pinmux config)")
-    print("Pin 33: PWM capable (may need pinmux config)")
-    print()
-    
-    print("SPECIAL FUNCTION PINS:")
-    print("----------------------")
-    print("Pin  3: I2C1 SDA (GPIO2)")
-    print("Pin  5: I2C1 SCL (GPIO3)")
-    print("Pin  8: UART TX (GPIO14)")
-    print("Pin 10: UART RX (GPIO15)")
-    print("Pin 19: SPI MOSI (GPIO10)")
-    print("Pin 21: SPI MISO (GPIO9)")
-    print("Pin 23: SPI SCLK (GPIO11)")
-    print("Pin 24: SPI CE0 (GPIO8)")
-    print("Pin 26: SPI CE1 (GPIO7)")
-    print()
+    sys.stdout.write(_PIN_FUNCTIONS)
 
 
 def print_pinmux_commands():
     """Print pinmux configuration commands for PWM"""
-    print("PWM Pinmux Configuration Commands")
-    print("=" * 35)
-    print("Some PWM pins may require hardware configuration:")
-    print()
-    print("Enable PWM on Pin 15:")
-    print("sudo busybox devmem 0x02440020 32 0x400")
-    print()
-    print("Enable PWM on Pin 33:")
-    print("sudo busybox devmem 0x02434040 32 0x401")
-    print()
-    print("Note: These commands are temporary (until reboot).")
-    print("For permanent configuration, modify the device tree.")
-    print()
+    sys.stdout.write(_PINMUX_COMMANDS)
 
 
 def print_wiring_examples():
     """Print common wiring examples"""
-    print("Common Wiring Examples")
-    print("=" * 22)
-    print()
-    
-    print("LED CONNECTION:")
-    print("---------------")
-    print("LED Anode (long leg) → GPIO Pin (e.g., Pin 18)")
-    print("LED Cathode (short leg) → 330Ω Resistor → Ground (e.g., Pin 6)")
-    print()
-    
-    print("BUTTON CONNECTION:")
-    print("------------------")
-    print("Button Terminal 1 → GPIO Pin (e.g., Pin 16)")
-    print("Button Terminal 2 → Ground (e.g., Pin 6)")
-    print("Note: Use internal pull-up in software")
-    print()
-    
-    print("SERVO CONNECTION:")
-    print("-----------------")
-    print("Servo Red Wire → 5V (Pin 2 or Pin 4)")
-    print("Servo Black/Brown Wire → Ground (e.g., Pin 6)")
-    print("Servo Orange/Yellow Wire → PWM Pin (Pin 15 or Pin 33)")
-    print()
-    
-    print("SENSOR CONNECTION (3.3V):")
-    print("--------------------------")
-    print("Sensor VCC → 3.3V (Pin 1 or Pin 17)")
-    print("Sensor GND → Ground (e.g., Pin 6)")
-    print("Sensor Signal → GPIO Pin (e.g., Pin 18)")
-    print()
+    sys.stdout.write(_WIRING_EXAMPLES)
+
+
+# Pin data is static reference information; build it once at import time
+# as (function, type) tuples so get_pin_info is a single dict probe
+_PIN_DATA = {
+    1: ("3.3V Power", "power"),
+    2: ("5V Power", "power"),
+    3: ("GPIO2 (I2C1 SDA)", "gpio"),
+    4: ("5V Power", "power"),
+    5: ("GPIO3 (I2C1 SCL)", "gpio"),
+    6: ("Ground", "ground"),
+    7: ("GPIO4", "gpio"),
+    8: ("GPIO14 (UART TX)", "gpio"),
+    9: ("Ground", "ground"),
+    10: ("GPIO15 (UART RX)", "gpio"),
+    11: ("GPIO17", "gpio"),
+    12: ("GPIO18", "gpio"),
+    13: ("GPIO27", "gpio"),
+    14: ("Ground", "ground"),
+    15: ("GPIO22 (PWM capable)", "gpio_pwm"),
+    16: ("GPIO23", "gpio"),
+    17: ("3.3V Power", "power"),
+    18: ("GPIO24", "gpio"),
+    19: ("GPIO10 (SPI MOSI)", "gpio"),
+    20: ("Ground", "ground"),
+    21: ("GPIO9 (SPI MISO)", "gpio"),
+    22: ("GPIO25", "gpio"),
+    23: ("GPIO11 (SPI SCLK)", "gpio"),
+    24: ("GPIO8 (SPI CE0)", "gpio"),
+    25: ("Ground", "ground"),
+    26: ("GPIO7 (SPI CE1)", "gpio"),
+    27: ("GPIO0 (I2C0 SDA)", "gpio"),
+    28: ("GPIO1 (I2C0 SCL)", "gpio"),
+    29: ("GPIO5", "gpio"),
+    30: ("Ground", "ground"),
+    31: ("GPIO6", "gpio"),
+    32: ("GPIO12", "gpio"),
+    33: ("GPIO13 (PWM capable)", "gpio_pwm"),
+    34: ("Ground", "ground"),
+    35: ("GPIO19", "gpio"),
+    36: ("GPIO16", "gpio"),
+    37: ("GPIO26", "gpio"),
+    38: ("GPIO20", "gpio"),
+    39: ("Ground", "ground"),
+    40: ("GPIO21", "gpio"),
+}
+
+_TYPE_DESC = {
+    "gpio": "Digital I/O capable",
+    "gpio_pwm": "Digital I/O + PWM capable",
+    "power": "Power supply pin",
+    "ground": "Ground connection",
+}
 
 
 def get_pin_info(pin_number):
-    """Get information about a specific pin"""
-    pin_data = {
-        1: {"function": "3.3V Power", "type": "power"},
-        2: {"function": "5V Power", "type": "power"},
-        3: {"function": "GPIO2 (I2C1 SDA)", "type": "gpio"},
-        4: {"function": "5V Power", "type": "power"},
-        5: {"function": "GPIO3 (I2C1 SCL)", "type": "gpio"},
-        6: {"function": "Ground", "type": "ground"},
-        7: {"function": "GPIO4", "type": "gpio"},
-        8: {"function": "GPIO14 (UART TX)", "type": "gpio"},
-        9: {"function": "Ground", "type": "ground"},
-        10: {"function": "GPIO15 (UART RX)", "type": "gpio"},
-        11: {"function": "GPIO17", "type": "gpio"},
-        12: {"function": "GPIO18", "type": "gpio"},
-        13: {"function": "GPIO27", "type": "gpio"},
-        14: {"function": "Ground", "type": "ground"},
-        15: {"function": "GPIO22 (PWM capable)", "type": "gpio_pwm"},
-        16: {"function": "GPIO23", "type": "gpio"},
-        17: {"function": "3.3V Power", "type": "power"},
-        18: {"function": "GPIO24", "type": "gpio"},
-        19: {"function": "GPIO10 (SPI MOSI)", "type": "gpio"},
-        20: {"function": "Ground", "type": "ground"},
-        21: {"function": "GPIO9 (SPI MISO)", "type": "gpio"},
-        22: {"function": "GPIO25", "type": "gpio"},
-        23: {"function": "GPIO11 (SPI SCLK)", "type": "gpio"},
-        24: {"function": "GPIO8 (SPI CE0)", "type": "gpio"},
-        25: {"function": "Ground", "type": "ground"},
-        26: {"function": "GPIO7 (SPI CE1)", "type": "gpio"},
-        27: {"function": "GPIO0 (I2C0 SDA)", "type": "gpio"},
-        28: {"function": "GPIO1 (I2C0 SCL)", "type": "gpio"},
-        29: {"function": "GPIO5", "type": "gpio"},
-        30: {"function": "Ground", "type": "ground"},
-        31: {"function": "GPIO6", "type": "gpio"},
-        32: {"function": "GPIO12", "type": "gpio"},
-        33: {"function": "GPIO13 (PWM capable)", "type": "gpio_pwm"},
-        34: {"function": "Ground", "type": "ground"},
-        35: {"function": "GPIO19", "type": "gpio"},
-        36: {"function": "GPIO16", "type": "gpio"},
-        37: {"function": "GPIO26", "type": "gpio"},
-        38: {"function": "GPIO20", "type": "gpio"},
-        39: {"function": "Ground", "type": "ground"},
-        40: {"function": "GPIO21", "type": "gpio"}
-    }
-    
-    if pin_number in pin_data:
-        return pin_data[pin_number]
-    else:
-        return {"function": "Invalid pin", "type": "invalid"}
+    """Get (function, type) information about a specific pin"""
+    return _PIN_DATA.get(pin_number, ("Invalid pin", "invalid"))
 
 
 def interactive_pin_lookup():
@@ -210,18 +213,13 @@ def interactive_pin_lookup():
                 print("Error: Pin number must be between 1 and 40")
                 continue
                 
-            pin_info = get_pin_info(pin_number)
-            
-            print(f"Pin {pin_number:2d}: {pin_info['function']}")
-            
-            if pin_info['type'] == 'gpio':
-                print("        → Digital I/O capable")
-            elif pin_info['type'] == 'gpio_pwm':
-                print("        → Digital I/O + PWM capable")
-            elif pin_info['type'] == 'power':
-                print("        → Power supply pin")
-            elif pin_info['type'] == 'ground':
-                print("        → Ground connection")
+            function, pin_type = get_pin_info(pin_number)
+
+            print(f"Pin {pin_number:2d}: {function}")
+
+            desc = _TYPE_DESC.get(pin_type)
+            if desc:
+                print(f"        → {desc}")
             print()
             
         except ValueError:
@@ -231,62 +229,64 @@ def interactive_pin_lookup():
             break
 
 
+def _show_all():
+    """Emit every reference section with a single buffered write"""
+    sys.stdout.write(
+        _PINOUT + "\n" + _PIN_FUNCTIONS + "\n" + _PINMUX_COMMANDS + "\n" + _WIRING_EXAMPLES
+    )
+
+
+_MENU_BANNER = (
+    "\n" + "=" * 60 + "\n"
+    "NVIDIA Orin Nano GPIO Pin Reference Tool\n"
+    + "=" * 60 + "\n"
+    "1. Show GPIO Pinout Diagram\n"
+    "2. Show Pin Functions\n"
+    "3. Show PWM Configuration Commands\n"
+    "4. Show Wiring Examples\n"
+    "5. Interactive Pin Lookup\n"
+    "6. Show All Information\n"
+    "0. Exit\n\n"
+)
+
+# O(1) dispatch table instead of a 7-branch if/elif chain per menu press
+_MENU = {
+    '1': print_gpio_pinout,
+    '2': print_pin_functions,
+    '3': print_pinmux_commands,
+    '4': print_wiring_examples,
+    '5': interactive_pin_lookup,
+    '6': _show_all,
+}
+
+
 def main():
     """Main function with menu system"""
     while True:
-        print("\n" + "="*60)
-        print("NVIDIA Orin Nano GPIO Pin Reference Tool")
-        print("="*60)
-        print("1. Show GPIO Pinout Diagram")
-        print("2. Show Pin Functions")
-        print("3. Show PWM Configuration Commands") 
-        print("4. Show Wiring Examples")
-        print("5. Interactive Pin Lookup")
-        print("6. Show All Information")
-        print("0. Exit")
-        print()
-        
+        sys.stdout.write(_MENU_BANNER)
+
         try:
             choice = input("Select option (0-6): ").strip()
-            
-            if choice == '0':
-                print("Goodbye!")
-                break
-            elif choice == '1':
-                print()
-                print_gpio_pinout()
-            elif choice == '2':
-                print()
-                print_pin_functions()
-            elif choice == '3':
-                print()
-                print_pinmux_commands()
-            elif choice == '4':
-                print()
-                print_wiring_examples()
-            elif choice == '5':
-                print()
-                interactive_pin_lookup()
-            elif choice == '6':
-                print()
-                print_gpio_pinout()
-                print()
-                print_pin_functions()
-                print()
-                print_pinmux_commands()
-                print()
-                print_wiring_examples()
-            else:
-                print("Invalid choice. Please select 0-6.")
-                
         except KeyboardInterrupt:
             print("\nExiting...")
             break
-        except Exception as e:
-            print(f"Error: {e}")
-            
-        input("\nPress Enter to continue...")
+
+        handler = _MENU.get(choice)
+        if handler is not None:
+            print()
+            handler()
+        elif choice == '0':
+            print("Goodbye!")
+            break
+        else:
+            print("Invalid choice. Please select 0-6.")
+
+        try:
+            input("\nPress Enter to continue...")
+        except KeyboardInterrupt:
+            print("\nExiting...")
+            break
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -17,7 +17,10 @@ Usage:
 import sys
 import os
 import argparse
+import importlib
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add the src directory to the path to import our library  
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -25,82 +28,104 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from stickbot import setup_gpio, cleanup_gpio, print_board_info, get_available_pins, check_pin_function
 
 
-def test_pin_as_output(pin_number):
-    """Test a pin as digital output"""
+def _load_gpio():
+    """Resolve the GPIO backend module once for the whole script"""
     try:
-        import Jetson.GPIO as GPIO
+        return importlib.import_module('Jetson.GPIO')
     except ImportError:
-        import RPi.GPIO as GPIO
-    
-    print(f"Testing pin {pin_number} as OUTPUT...")
+        return importlib.import_module('RPi.GPIO')
+
+
+# Resolved once at import time so the per-pin test functions (and the
+# scan loop that calls them repeatedly) skip the import machinery
+_GPIO = _load_gpio()
+
+# Serializes output from concurrent pin tests so lines from different
+# workers do not interleave mid-line
+_print_lock = threading.Lock()
+
+
+def _log(msg):
+    """Print one line under the shared print lock"""
+    with _print_lock:
+        print(msg)
+
+
+def test_pin_as_output(pin_number, cleanup=True):
+    """Test a pin as digital output"""
+    GPIO = _GPIO
+
+    _log(f"Testing pin {pin_number} as OUTPUT...")
     
     try:
         GPIO.setmode(GPIO.BOARD)
-        GPIO.setup(pin_number, GPIO.OUT, initial=GPIO.LOW)
-        
-        print("  Setting HIGH for 2 seconds...")
-        GPIO.output(pin_number, GPIO.HIGH)
+        # Configure the pin directly to its first test level: setup with
+        # initial=HIGH drives the line in the same call, so there is no
+        # LOW-then-HIGH double transition at the start of the test
+        GPIO.setup(pin_number, GPIO.OUT, initial=GPIO.HIGH)
+
+        _log("  Setting HIGH for 2 seconds...")
         time.sleep(2)
-        
-        print("  Setting LOW for 2 seconds...")  
+
+        _log("  Setting LOW for 2 seconds...")
         GPIO.output(pin_number, GPIO.LOW)
         time.sleep(2)
         
-        print(f"  Pin {pin_number} output test completed successfully")
+        _log(f"  Pin {pin_number} output test completed successfully")
         return True
         
     except Exception as e:
-        print(f"  Error testing pin {pin_number} as output: {e}")
+        _log(f"  Error testing pin {pin_number} as output: {e}")
         return False
     finally:
-        try:
-            GPIO.cleanup(pin_number)
-        except:
-            pass
+        if cleanup:
+            try:
+                GPIO.cleanup(pin_number)
+            except:
+                pass
 
 
-def test_pin_as_input(pin_number):
+def test_pin_as_input(pin_number, cleanup=True):
     """Test a pin as digital input"""
-    try:
-        import Jetson.GPIO as GPIO
-    except ImportError:
-        import RPi.GPIO as GPIO
-    
-    print(f"Testing pin {pin_number} as INPUT...")
+    GPIO = _GPIO
+
+    _log(f"Testing pin {pin_number} as INPUT...")
     
     try:
         GPIO.setmode(GPIO.BOARD)
         GPIO.setup(pin_number, GPIO.IN, pull_up_down=GPIO.PUD_UP)
         
-        print("  Reading pin state for 5 seconds (try connecting to ground)...")
+        _log("  Reading pin state for 5 seconds (try connecting to ground)...")
+        # Bind the hot attributes as locals so the 50-iteration loop does
+        # plain fast-local loads instead of module attribute lookups
+        inp = GPIO.input
+        high = GPIO.HIGH
         for i in range(50):  # 5 seconds of readings
-            state = GPIO.input(pin_number)
-            state_str = "HIGH" if state == GPIO.HIGH else "LOW"
+            state = inp(pin_number)
+            state_str = "HIGH" if state == high else "LOW"
             if i % 10 == 0:  # Print every 10th reading
-                print(f"    Reading {i//10 + 1}: {state_str}")
+                _log(f"    Reading {i//10 + 1}: {state_str}")
             time.sleep(0.1)
         
-        print(f"  Pin {pin_number} input test completed successfully")
+        _log(f"  Pin {pin_number} input test completed successfully")
         return True
         
     except Exception as e:
-        print(f"  Error testing pin {pin_number} as input: {e}")
+        _log(f"  Error testing pin {pin_number} as input: {e}")
         return False
     finally:
-        try:
-            GPIO.cleanup(pin_number)
-        except:
-            pass
+        if cleanup:
+            try:
+                GPIO.cleanup(pin_number)
+            except:
+                pass
 
 
-def test_pin_as_pwm(pin_number):
+def test_pin_as_pwm(pin_number, cleanup=True):
     """Test a pin for PWM capability"""
-    try:
-        import Jetson.GPIO as GPIO
-    except ImportError:
-        import RPi.GPIO as GPIO
-    
-    print(f"Testing pin {pin_number} for PWM capability...")
+    GPIO = _GPIO
+
+    _log(f"Testing pin {pin_number} for PWM capability...")
     
     try:
         GPIO.setmode(GPIO.BOARD)
@@ -110,71 +135,95 @@ def test_pin_as_pwm(pin_number):
         pwm = GPIO.PWM(pin_number, 1000)
         pwm.start(50)  # 50% duty cycle
         
-        print("  PWM started successfully at 50% duty cycle")
+        _log("  PWM started successfully at 50% duty cycle")
         time.sleep(2)
         
-        print("  Testing duty cycle changes...")
+        _log("  Testing duty cycle changes...")
         for duty in [25, 75, 50]:
             pwm.ChangeDutyCycle(duty)
-            print(f"    Changed to {duty}% duty cycle")
+            _log(f"    Changed to {duty}% duty cycle")
             time.sleep(1)
         
         pwm.stop()
-        print(f"  Pin {pin_number} PWM test completed successfully")
+        _log(f"  Pin {pin_number} PWM test completed successfully")
         return True
         
     except Exception as e:
-        print(f"  Pin {pin_number} does not support PWM: {e}")
+        _log(f"  Pin {pin_number} does not support PWM: {e}")
         return False
+    finally:
+        if cleanup:
+            try:
+                GPIO.cleanup(pin_number)
+            except:
+                pass
+
+
+def test_one_pin(pin, try_pwm=False):
+    """
+    Run the full test sequence for one pin
+
+    Returns (pin, result_dict) with booleans for each phase so callers
+    can run pins concurrently and aggregate as results arrive. A pin
+    that fails the output test is not tested further.
+    """
+    result = {'output': False, 'input': False, 'pwm': False}
+
+    # Each phase reconfigures the pin in place with GPIO.setup, so the
+    # line stays claimed for the whole sequence and is released exactly
+    # once here instead of being torn down and re-acquired per phase
+    try:
+        result['output'] = test_pin_as_output(pin, cleanup=False)
+        if result['output']:
+            result['input'] = test_pin_as_input(pin, cleanup=False)
+            if try_pwm:
+                result['pwm'] = test_pin_as_pwm(pin, cleanup=False)
     finally:
         try:
-            GPIO.cleanup(pin_number)
+            _GPIO.cleanup(pin)
         except:
             pass
 
+    return pin, result
+
 
 def scan_all_pins():
     """Scan and test all available pins"""
     print("=== Scanning All Available Pins ===")
-    
+
     pins_info = get_available_pins()
     digital_pins = pins_info.get('digital', [])
     pwm_pins = pins_info.get('pwm_capable', [])
-    
+
     print(f"Found {len(digital_pins)} digital pins to test")
-    
+
     results = {
         'output_working': [],
         'input_working': [],
         'pwm_working': [],
         'failed': []
     }
-    
-    for pin in digital_pins:
-        print(f"\n--- Testing Pin {pin} ---")
-        
-        # Test as output
-        if test_pin_as_output(pin):
+
+    # The per-pin tests are dominated by sleeps, so testing four pins at
+    # a time cuts the scan roughly fourfold; each pin's GPIO state is
+    # independent, and _log keeps the output readable
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(test_one_pin, pin, pin in pwm_pins)
+                   for pin in digital_pins]
+        for future in as_completed(futures):
+            pin, result = future.result()
+            if not result['output']:
+                results['failed'].append(pin)
+                continue
             results['output_working'].append(pin)
-        else:
-            results['failed'].append(pin)
-            continue
-        
-        time.sleep(0.5)
-        
-        # Test as input
-        if test_pin_as_input(pin):
-            results['input_working'].append(pin)
-        
-        time.sleep(0.5)
-        
-        # Test PWM if this pin is supposed to support it
-        if pin in pwm_pins:
-            if test_pin_as_pwm(pin):
+            if result['input']:
+                results['input_working'].append(pin)
+            if result['pwm']:
                 results['pwm_working'].append(pin)
-        
-        time.sleep(1)  # Brief pause between pins
-    
+
+    for pins in results.values():
+        pins.sort()
+
     # Print results summary
     print("\n=== Scan Results Summary ===")
     print(f"Output working pins: {results['output_working']}")
@@ -252,12 +301,10 @@ def main():
             elif args.pwm_only:
                 test_pin_as_pwm(pin)
             else:
-                # Test all functions
-                test_pin_as_output(pin)
-                time.sleep(1)
-                test_pin_as_input(pin)
-                time.sleep(1)
-                test_pin_as_pwm(pin)
+                # Run the fused sequence: the pin is claimed once,
+                # reconfigured in place between phases, and released
+                # once, with no padding sleeps in between
+                test_one_pin(pin, try_pwm=True)
         elif args.scan_pins:
             scan_all_pins()
         else:
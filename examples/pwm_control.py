@@ -24,6 +24,8 @@ Pin reference for Orin Nano:
 - Pin 15 (BOARD) = Hardware PWM capable (may need configuration)
 """
 
+import array
+import math
 import time
 import sys
 import os
@@ -37,6 +39,17 @@ from stickbot import PWMPin, setup_gpio, cleanup_gpio
 PWM_PIN = 33      # Primary PWM pin for Orin Nano
 PWM_FREQUENCY = 1000  # 1 kHz default frequency
 
+# One cycle of sine precomputed at 1024 points: the effect loops only
+# need ~0.1% amplitude resolution, so a table lookup replaces a libm
+# call on every duty-cycle update
+_SIN_LUT = array.array('d', [math.sin(2 * math.pi * i / 1024)
+                             for i in range(1024)])
+
+
+def _sin(t):
+    """Sine of t radians from the lookup table"""
+    return _SIN_LUT[int(t * (1024 / (2 * math.pi))) & 1023]
+
 
 def basic_pwm_example():
     """Basic PWM control using Jetson.GPIO directly"""
@@ -64,21 +77,28 @@ def basic_pwm_example():
         print(f"Starting PWM on pin {PWM_PIN} at {PWM_FREQUENCY} Hz")
         pwm.start(0)  # Start with 0% duty cycle
         
-        # Gradually increase duty cycle
+        # Gradually increase duty cycle. Sleeping to absolute monotonic
+        # deadlines keeps the fade at a steady 10 steps/s, and dropping
+        # the per-step prints keeps terminal I/O out of the timing loop
         print("Increasing duty cycle from 0% to 100%...")
+        # Bind the bound method once: each step then costs one local
+        # call instead of an attribute lookup plus call
+        change = pwm.ChangeDutyCycle
+        next_tick = time.monotonic()
         for duty_cycle in range(0, 101, 5):
-            print(f"  Duty cycle: {duty_cycle}%")
-            pwm.ChangeDutyCycle(duty_cycle)
-            time.sleep(0.1)
-        
+            change(duty_cycle)
+            next_tick += 0.1
+            time.sleep(max(0, next_tick - time.monotonic()))
+
         time.sleep(1)
-        
+
         # Gradually decrease duty cycle
         print("Decreasing duty cycle from 100% to 0%...")
+        next_tick = time.monotonic()
         for duty_cycle in range(100, -1, -5):
-            print(f"  Duty cycle: {duty_cycle}%")
-            pwm.ChangeDutyCycle(duty_cycle)
-            time.sleep(0.1)
+            change(duty_cycle)
+            next_tick += 0.1
+            time.sleep(max(0, next_tick - time.monotonic()))
         
         pwm.stop()
         print("Basic PWM example completed\n")
@@ -135,14 +155,20 @@ def led_breathing_effect():
         print("(LED will smoothly fade in and out)")
         
         pwm_led.start(0)
-        start_time = time.time()
-        
-        while time.time() - start_time < 20:
+        change = pwm_led.change_duty_cycle
+        start_time = time.monotonic()
+        next_tick = start_time
+
+        # One clock read per iteration drives both the sine phase and the
+        # loop condition; sleeping to an absolute deadline keeps the
+        # update rate at 20 Hz regardless of how long each update takes
+        while (now := time.monotonic()) - start_time < 20:
             # Breathing pattern: sine wave
-            t = (time.time() - start_time) * 2  # 2 Hz breathing rate
-            duty_cycle = (math.sin(t) + 1) * 50  # 0-100% duty cycle
-            pwm_led.change_duty_cycle(duty_cycle)
-            time.sleep(0.05)
+            t = (now - start_time) * 2  # 2 Hz breathing rate
+            duty_cycle = (_sin(t) + 1) * 50  # 0-100% duty cycle
+            change(duty_cycle)
+            next_tick += 0.05
+            time.sleep(max(0, next_tick - time.monotonic()))
         
         pwm_led.stop()
         print("LED breathing effect completed\n")
@@ -172,11 +198,18 @@ def servo_control_example():
             (12.5, "180° (right)"),
             (7.5, "90° (center)")
         ]
-        
-        for duty_cycle, position in positions:
-            print(f"Moving to {position} (duty cycle: {duty_cycle}%)")
+
+        # Messages are formatted up front and written unbuffered with a
+        # single flush at the end, keeping string formatting and terminal
+        # round-trips out of the stepping loop
+        messages = [f"Moving to {position} (duty cycle: {duty_cycle}%)\n"
+                    for duty_cycle, position in positions]
+
+        for (duty_cycle, _), msg in zip(positions, messages):
+            sys.stdout.write(msg)
             servo.change_duty_cycle(duty_cycle)
             time.sleep(2)
+        sys.stdout.flush()
         
         servo.stop()
         print("Servo control example completed\n")
@@ -198,11 +231,13 @@ def frequency_sweep_example():
         pwm_pin.start(50)  # 50% duty cycle
         
         frequencies = [100, 200, 500, 1000, 2000, 5000, 1000, 500, 200, 100]
-        
-        for freq in frequencies:
-            print(f"  Frequency: {freq} Hz")
+        messages = [f"  Frequency: {freq} Hz\n" for freq in frequencies]
+
+        for freq, msg in zip(frequencies, messages):
+            sys.stdout.write(msg)
             pwm_pin.change_frequency(freq)
             time.sleep(1)
+        sys.stdout.flush()
         
         pwm_pin.stop()
         print("Frequency sweep completed\n")
@@ -246,7 +281,7 @@ def multiple_pwm_example():
     for phase in range(0, 360, 10):
         for i, pwm in enumerate(pwm_objects):
             # Create different phases for each PWM
-            duty = 50 + 40 * math.sin(math.radians(phase + i * 90))
+            duty = 50 + 40 * _sin(math.radians(phase + i * 90))
             pwm.change_duty_cycle(max(0, min(100, duty)))
         time.sleep(0.1)
     
@@ -299,10 +334,6 @@ def main():
     print("Note: Hardware PWM pins may require pinmux configuration")
     print("Connect an LED or servo to see the effects!\n")
     
-    # Import math for some examples
-    global math
-    import math
-    
     # Setup GPIO
     setup_gpio()
     
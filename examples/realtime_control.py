@@ -35,7 +35,14 @@ import tty
 # Add the src directory to the path to import our library
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from stickbot import DigitalPin, setup_gpio, cleanup_gpio
+from stickbot import PinBank, MmapGPIO, setup_gpio, cleanup_gpio
+
+# Resolve the GPIO backend once at module scope instead of importing it
+# inside the controller constructor
+try:
+    import Jetson.GPIO as GPIO
+except ImportError:
+    import RPi.GPIO as GPIO
 
 # GPIO pin mapping for keys 1-6
 PIN_MAPPING = {
@@ -47,56 +54,105 @@ PIN_MAPPING = {
     '6': 7,   # Key 6 → Pin 7
 }
 
+# Register map for the mmap fast path: BOARD pin → (register offset, bit)
+# inside the Tegra GPIO controller window. Offsets come from the SoC
+# Technical Reference Manual, not the header silkscreen, so fill this in
+# for your board before enabling use_mmap.
+MMAP_REGISTERS = {}
+
 class NonBlockingInput:
     """Handle non-blocking keyboard input on Linux/Unix"""
     
     def __init__(self):
-        self.old_settings = termios.tcgetattr(sys.stdin)
-        tty.setraw(sys.stdin.fileno())
+        # Cache the stdin file descriptor once: select and os.read work
+        # on the raw fd, skipping the TextIOWrapper layer entirely
+        self.fd = sys.stdin.fileno()
+        self.old_settings = termios.tcgetattr(self.fd)
+        tty.setraw(self.fd)
         
-    def __del__(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Deterministic terminal restore on scope exit, instead of
+        # relying on a __del__ that may run late or not at all
         self.restore()
-        
+
     def restore(self):
         """Restore terminal settings"""
         try:
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old_settings)
         except:
             pass
             
-    def get_char(self):
-        """Get a character if available, return None if no input"""
-        if select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], []):
-            return sys.stdin.read(1)
+    def get_char(self, timeout=0):
+        """
+        Get a character, waiting up to timeout seconds for one
+
+        Blocks in select until input arrives or the timeout expires, so
+        callers do not need their own polling sleep. Returns None on
+        timeout.
+        """
+        if select.select([self.fd], [], [], timeout)[0]:
+            return os.read(self.fd, 1).decode('latin1')
         return None
 
 
 class RealTimeGPIOController:
     """Real-time GPIO controller with keyboard input"""
     
-    def __init__(self):
-        self.pins = {}
-        self.pin_states = {}
+    def __init__(self, use_mmap=False):
         self.running = True
         self.input_handler = None
-        
+
         # Setup GPIO
         setup_gpio()
-        
-        try:
-            import Jetson.GPIO as GPIO
-        except ImportError:
-            import RPi.GPIO as GPIO
-        
-        # Initialize all pins as outputs
+
+        # Optional mmap fast path: drive pins with direct register stores
+        # through /dev/mem instead of backend calls. Needs root and a
+        # populated MMAP_REGISTERS table for this board.
+        self.mmap_gpio = None
+        if use_mmap:
+            if not MMAP_REGISTERS:
+                print("use_mmap requested but MMAP_REGISTERS is empty; "
+                      "falling back to the standard backend")
+            else:
+                try:
+                    self.mmap_gpio = MmapGPIO()
+                except (PermissionError, OSError) as e:
+                    print(f"Could not map GPIO registers ({e}); "
+                          "falling back to the standard backend")
+
+        # Probe which pins can be configured, then drive them as one
+        # PinBank: every update is a single batched write for the whole
+        # bank instead of one backend call per pin
+        GPIO.setmode(GPIO.BOARD)
+        self.keys = []
+        available = []
         for key, pin_num in PIN_MAPPING.items():
             try:
-                pin = DigitalPin(pin_num, GPIO.OUT, GPIO.LOW)
-                self.pins[key] = pin
-                self.pin_states[key] = False
+                GPIO.setup(pin_num, GPIO.OUT, initial=GPIO.LOW)
+                self.keys.append(key)
+                available.append(pin_num)
                 print(f"Initialized Pin {pin_num} for key '{key}'")
             except Exception as e:
                 print(f"Warning: Could not initialize pin {pin_num} for key '{key}': {e}")
+
+        self.bank = PinBank(available, GPIO.OUT) if available else None
+
+        # Flat dispatch tables indexed by ord(key) - ord('1'): slot k
+        # holds the bank bit for key k+1 (or None if its pin failed
+        # setup) and the BOARD pin number, so a keypress costs two list
+        # indexes instead of a chain of dict probes
+        self._key_slots = [None] * len(PIN_MAPPING)
+        self._key_pins = [None] * len(PIN_MAPPING)
+        for i, key in enumerate(self.keys):
+            k = ord(key) - 49
+            self._key_slots[k] = i
+            self._key_pins[k] = PIN_MAPPING[key]
+
+        # Pin states as an integer bitmap (bit i = state of self.keys[i])
+        self.state_mask = 0
     
     def print_instructions(self):
         """Print usage instructions"""
@@ -109,7 +165,7 @@ class RealTimeGPIOController:
         print()
         print("Pin Mapping:")
         for key, pin_num in PIN_MAPPING.items():
-            status = "✓" if key in self.pins else "✗"
+            status = "✓" if self._key_slots[ord(key) - 49] is not None else "✗"
             print(f"  Key '{key}' → Pin {pin_num:2d} {status}")
         print()
         print("Status: Ready - Start pressing keys!")
@@ -129,32 +185,39 @@ class RealTimeGPIOController:
         print("Press keys 1-6 to toggle pins, 0 to exit\n")
         
         try:
-            self.input_handler = NonBlockingInput()
-            
-            while self.running:
-                char = self.input_handler.get_char()
-                
-                if char == '0' or (char and ord(char) == 27):
-                    print(f"\nExit key pressed. Shutting down...")
-                    self.running = False
-                    break
-                
-                if char and char in PIN_MAPPING and char in self.pins:
-                    # Toggle pin state
-                    current_state = self.pin_states[char]
-                    new_state = not current_state
-                    
-                    if new_state:
-                        self.pins[char].set_high()
-                        print(f"Key '{char}' → Pin {PIN_MAPPING[char]} ON ")
-                    else:
-                        self.pins[char].set_low()
-                        print(f"Key '{char}' → Pin {PIN_MAPPING[char]} OFF")
-                    
-                    self.pin_states[char] = new_state
-                
-                time.sleep(0.01)
+            with NonBlockingInput() as self.input_handler:
+                while self.running:
+                    # Block in select until a key arrives (bounded so Ctrl+C
+                    # stays responsive) instead of spinning every 10 ms
+                    char = self.input_handler.get_char(timeout=0.5)
+
+                    if char == '0' or (char and ord(char) == 27):
+                        print(f"\nExit key pressed. Shutting down...")
+                        self.running = False
+                        break
                 
+                    k = ord(char) - 49 if char else -1
+                    if 0 <= k < len(self._key_slots) and self._key_slots[k] is not None:
+                        # Toggle the key's bit and push the whole bank state
+                        # with one batched write (or one register store on
+                        # the mmap fast path)
+                        idx = self._key_slots[k]
+                        self.state_mask ^= 1 << idx
+                        pin = self._key_pins[k]
+                        if self.mmap_gpio is not None and pin in MMAP_REGISTERS:
+                            reg, bit = MMAP_REGISTERS[pin]
+                            if (self.state_mask >> idx) & 1:
+                                self.mmap_gpio.set_high(reg, bit)
+                            else:
+                                self.mmap_gpio.set_low(reg, bit)
+                        else:
+                            self.bank.write_all(self.state_mask)
+
+                        if (self.state_mask >> idx) & 1:
+                            print(f"Key '{char}' → Pin {pin} ON ")
+                        else:
+                            print(f"Key '{char}' → Pin {pin} OFF")
+
         except KeyboardInterrupt:
             print("\nInterrupted by user")
         finally:
@@ -164,14 +227,21 @@ class RealTimeGPIOController:
         """Clean up resources"""
         print("\nCleaning up...")
         
-        # Set all pins LOW
-        for key, pin in self.pins.items():
+        # Set all pins LOW with one batched write
+        if self.bank is not None:
             try:
-                pin.set_low()
-                print(f"Pin {PIN_MAPPING[key]} set to LOW")
+                self.bank.write_all(0)
+                self.state_mask = 0
+                for key in self.keys:
+                    print(f"Pin {PIN_MAPPING[key]} set to LOW")
             except:
                 pass
         
+        # Release the register mapping if the mmap fast path was active
+        if self.mmap_gpio is not None:
+            self.mmap_gpio.close()
+            self.mmap_gpio = None
+
         # Restore terminal
         if self.input_handler:
             self.input_handler.restore()
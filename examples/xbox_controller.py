@@ -7,10 +7,17 @@ all button presses, joystick movements, and trigger actions in real-time.
 
 Requirements:
     source ~/solo_venv/bin/activate
-    pip install inputs
+    pip install evdev
 
 Usage:
-    python xbox_controller.py
+    python xbox_controller.py [/dev/input/eventN]
+
+The controller is auto-detected by scanning the input devices for one
+that advertises gamepad buttons; pass an explicit event node as the
+first argument to skip the scan.
+
+For a dependency-free alternative that parses /dev/input directly, see
+xbox_controller_direct.py.
 
 Supported Inputs:
     - Buttons: A, B, X, Y, Start, Back, Guide, Left/Right Bumpers
@@ -20,86 +27,183 @@ Supported Inputs:
 """
 
 try:
-    from inputs import get_gamepad
+    from evdev import InputDevice, ecodes, list_devices
 except ImportError:
-    print("Error: 'inputs' library not found.")
-    print("Install it with: pip install inputs")
+    print("Error: 'evdev' library not found.")
+    print("Install it with: pip install evdev")
     exit(1)
 
 import sys
+import time
 
 
-def print_controller_event(event):
+def find_controller(path=None):
     """
-    Print controller events in a readable format.
-    
+    Open the controller's event device.
+
+    With an explicit path, open that node directly. Otherwise scan every
+    input device and pick the first one advertising gamepad buttons
+    (BTN_SOUTH, the A button) in its capabilities - the node a
+    controller enumerates as varies per boot, so a hardcoded
+    /dev/input/eventN is not portable.
+
     Args:
-        event: Input event from the controller
+        path: Optional event device node, e.g. '/dev/input/event3'
+
+    Returns:
+        An opened evdev.InputDevice
+
+    Raises:
+        OSError: If no gamepad is found or the device cannot be opened
     """
-    event_type = event.ev_type
+    if path is not None:
+        return InputDevice(path)
+
+    for dev_path in list_devices():
+        device = InputDevice(dev_path)
+        if ecodes.BTN_SOUTH in device.capabilities().get(ecodes.EV_KEY, ()):
+            return device
+        device.close()
+
+    raise OSError("no gamepad found among input devices")
+
+# Output lines buffered between flushes: one sys.stdout.write of the
+# joined batch replaces a print (and often a terminal write) per event.
+# Flushed when the buffer is full or it has been holding lines too long.
+_out_buf = []
+_FLUSH_COUNT = 64
+_FLUSH_INTERVAL = 0.05  # seconds
+_last_flush = time.monotonic()
+
+
+def _flush_output(force=False):
+    """Write out buffered event lines if due (or forced)"""
+    global _last_flush
+    now = time.monotonic()
+    if not force and len(_out_buf) < _FLUSH_COUNT \
+            and now - _last_flush < _FLUSH_INTERVAL:
+        return
+    if _out_buf:
+        sys.stdout.write(''.join(_out_buf))
+        sys.stdout.flush()
+        del _out_buf[:]
+    _last_flush = now
+
+
+# Event code → friendly name tables, built once at import and keyed by
+# the raw integer codes the kernel delivers - no string conversion in
+# the event path
+_BUTTON_NAMES = {
+    ecodes.BTN_SOUTH: 'A',
+    ecodes.BTN_EAST: 'B',
+    ecodes.BTN_NORTH: 'X',
+    ecodes.BTN_WEST: 'Y',
+    ecodes.BTN_TL: 'Left Bumper (LB)',
+    ecodes.BTN_TR: 'Right Bumper (RB)',
+    ecodes.BTN_SELECT: 'Back/View',
+    ecodes.BTN_START: 'Start/Menu',
+    ecodes.BTN_MODE: 'Xbox Guide',
+    ecodes.BTN_THUMBL: 'Left Stick Click',
+    ecodes.BTN_THUMBR: 'Right Stick Click',
+}
+
+_ANALOG_NAMES = {
+    ecodes.ABS_X: 'Left Stick X',
+    ecodes.ABS_Y: 'Left Stick Y',
+    ecodes.ABS_RX: 'Right Stick X',
+    ecodes.ABS_RY: 'Right Stick Y',
+    ecodes.ABS_Z: 'Left Trigger (LT)',
+    ecodes.ABS_RZ: 'Right Trigger (RT)',
+    ecodes.ABS_HAT0X: 'D-Pad X',
+    ecodes.ABS_HAT0Y: 'D-Pad Y',
+}
+
+# Last printed value per analog axis, used to drop near-duplicate events.
+# Sticks and triggers stream a reading every few milliseconds even when
+# barely moving; only changes larger than the axis' hysteresis threshold
+# are worth a line of output.
+_last_axis_state = {}
+
+_AXIS_HYSTERESIS = {
+    ecodes.ABS_X: 1000,
+    ecodes.ABS_Y: 1000,
+    ecodes.ABS_RX: 1000,
+    ecodes.ABS_RY: 1000,
+    ecodes.ABS_Z: 5,
+    ecodes.ABS_RZ: 5,
+}
+
+# Axis groups as frozensets: hashed membership tests instead of a linear
+# scan of a freshly built tuple per event
+_DPAD = frozenset((ecodes.ABS_HAT0X, ecodes.ABS_HAT0Y))
+_TRIG = frozenset((ecodes.ABS_Z, ecodes.ABS_RZ))
+_STICK = frozenset((ecodes.ABS_X, ecodes.ABS_Y, ecodes.ABS_RX, ecodes.ABS_RY))
+
+
+def print_controller_events(events):
+    """
+    Print a stream of controller events in a readable format.
+
+    Works with any iterable of evdev events, including the endless
+    generator from InputDevice.read_loop(). Analog events that moved
+    less than their hysteresis threshold since the last printed value
+    are dropped, and output goes through the flush buffer above.
+
+    Args:
+        events: Iterable of evdev input events
+    """
+    for event in events:
+        _print_controller_event(event)
+        _flush_output()
+
+
+def _print_controller_event(event, _bn=_BUTTON_NAMES.get, _an=_ANALOG_NAMES.get):
+    """Print a single controller event"""
+    event_type = event.type
     code = event.code
-    state = event.state
-    
+    state = event.value
+
     # Button events
-    if event_type == 'Key':
-        button_names = {
-            'BTN_SOUTH': 'A',
-            'BTN_EAST': 'B',
-            'BTN_NORTH': 'X',
-            'BTN_WEST': 'Y',
-            'BTN_TL': 'Left Bumper (LB)',
-            'BTN_TR': 'Right Bumper (RB)',
-            'BTN_SELECT': 'Back/View',
-            'BTN_START': 'Start/Menu',
-            'BTN_MODE': 'Xbox Guide',
-            'BTN_THUMBL': 'Left Stick Click',
-            'BTN_THUMBR': 'Right Stick Click',
-        }
-        
-        button_name = button_names.get(code, code)
+    if event_type == ecodes.EV_KEY:
+        button_name = _bn(code, code)
         action = "PRESSED" if state == 1 else "RELEASED"
-        print(f"[BUTTON] {button_name}: {action}")
-    
+        _out_buf.append(f"[BUTTON] {button_name}: {action}\n")
+
     # Analog events (joysticks and triggers)
-    elif event_type == 'Absolute':
-        analog_names = {
-            'ABS_X': 'Left Stick X',
-            'ABS_Y': 'Left Stick Y',
-            'ABS_RX': 'Right Stick X',
-            'ABS_RY': 'Right Stick Y',
-            'ABS_Z': 'Left Trigger (LT)',
-            'ABS_RZ': 'Right Trigger (RT)',
-            'ABS_HAT0X': 'D-Pad X',
-            'ABS_HAT0Y': 'D-Pad Y',
-        }
-        
-        analog_name = analog_names.get(code, code)
-        
+    elif event_type == ecodes.EV_ABS:
+        analog_name = _an(code, code)
+
+        # Hysteresis dedupe: skip axis readings that barely moved since
+        # the last one we printed
+        threshold = _AXIS_HYSTERESIS.get(code)
+        if threshold is not None:
+            last = _last_axis_state.get(code)
+            if last is not None and abs(state - last) < threshold:
+                return
+            _last_axis_state[code] = state
+
         # Format D-Pad directions
-        if code in ['ABS_HAT0X', 'ABS_HAT0Y']:
+        if code in _DPAD:
             if state == 0:
                 return  # Neutral position, skip printing
-            direction = ""
-            if code == 'ABS_HAT0X':
+            if code == ecodes.ABS_HAT0X:
                 direction = "RIGHT" if state > 0 else "LEFT"
             else:
                 direction = "DOWN" if state > 0 else "UP"
-            print(f"[D-PAD] {direction}")
-        
+            _out_buf.append(f"[D-PAD] {direction}\n")
+
         # Format triggers (0-255 range)
-        elif code in ['ABS_Z', 'ABS_RZ']:
+        elif code in _TRIG:
             if state > 10:  # Ignore noise near zero
                 percentage = (state / 255) * 100
-                print(f"[TRIGGER] {analog_name}: {state} ({percentage:.1f}%)")
-        
+                _out_buf.append(f"[TRIGGER] {analog_name}: {state} ({percentage:.1f}%)\n")
+
         # Format joysticks (typically -32768 to 32767)
-        elif code in ['ABS_X', 'ABS_Y', 'ABS_RX', 'ABS_RY']:
+        elif code in _STICK:
             if abs(state) > 3000:  # Ignore small deadzone movements
-                print(f"[JOYSTICK] {analog_name}: {state}")
-    
-    # Sync events (can be ignored)
-    elif event_type == 'Sync':
-        pass
+                _out_buf.append(f"[JOYSTICK] {analog_name}: {state}\n")
+
+    # Sync and other event types are ignored
 
 
 def main():
@@ -110,24 +214,26 @@ def main():
     print("\nSearching for Xbox controller...")
     print("Please ensure your controller is connected via USB or Bluetooth.\n")
     
+    device_path = sys.argv[1] if len(sys.argv) > 1 else None
+
     try:
-        print("Controller found! Reading inputs...")
+        device = find_controller(device_path)
+        print(f"Controller found: {device.name} ({device.path})")
         print("Press Ctrl+C to exit.\n")
         print("-" * 60)
-        
-        # Continuously read events from the controller
-        while True:
-            events = get_gamepad()
-            for event in events:
-                print_controller_event(event)
+
+        # read_loop() blocks in the kernel until events arrive, so there
+        # is no polling; events stream straight into the printer
+        print_controller_events(device.read_loop())
                 
     except KeyboardInterrupt:
+        _flush_output(force=True)
         print("\n" + "-" * 60)
         print("Exiting...")
         sys.exit(0)
         
-    except Exception as e:
-        print(f"\nError: {e}")
+    except OSError as e:
+        print(f"\nError: controller not found ({e}).")
         print("\nTroubleshooting:")
         print("1. Check if controller is connected: ls /dev/input/js*")
         print("2. Check permissions:")
@@ -21,107 +21,219 @@ Supported Inputs:
     - Triggers: Left (LT) and Right (RT) triggers
 """
 
+import selectors
 import struct
 import sys
 import os
 import time
 
+# Optional numba JIT: when installed, the numeric axis classification
+# below compiles to native code; without it the plain Python function
+# is used as-is
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
-# Xbox controller button mappings
-BUTTON_NAMES = {
-    0: 'A',
-    1: 'B', 
-    2: 'X',
-    3: 'Y',
-    4: 'Left Bumper (LB)',
-    5: 'Right Bumper (RB)',
-    6: 'Back/View',
-    7: 'Start/Menu',
-    8: 'Xbox Guide',
-    9: 'Left Stick Click',
-    10: 'Right Stick Click',
-}
-
-# Xbox controller axis mappings
-AXIS_NAMES = {
-    0: 'Left Stick X',
-    1: 'Left Stick Y',
-    2: 'Left Trigger (LT)',
-    3: 'Right Stick X',
-    4: 'Right Stick Y',
-    5: 'Right Trigger (RT)',
-    6: 'D-Pad X',
-    7: 'D-Pad Y',
-}
+# Optional numpy: a read chunk can then be parsed as one typed array
+# view with the init-event filter vectorized, instead of unpacking
+# tuples event by event
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Joystick event layout, compiled once: unsigned int time, short value,
+# unsigned char type, unsigned char number. A prebuilt Struct skips the
+# format-string parse struct.unpack() redoes on every event.
+_EVENT_STRUCT = struct.Struct('IhBB')
+_EVENT_SIZE = _EVENT_STRUCT.size
+
+# The same layout as a numpy record dtype for the frombuffer fast path
+if np is not None:
+    _EVENT_DTYPE = np.dtype([('t', '<u4'), ('v', '<i2'),
+                             ('type', 'u1'), ('num', 'u1')])
+
+
+# Xbox controller button and axis mappings. The kernel numbers both
+# densely from zero, so tuples indexed by position replace dict lookups
+# in the event path; numbers past the end fall back to a generic label.
+_BUTTON_NAMES = (
+    'A',
+    'B',
+    'X',
+    'Y',
+    'Left Bumper (LB)',
+    'Right Bumper (RB)',
+    'Back/View',
+    'Start/Menu',
+    'Xbox Guide',
+    'Left Stick Click',
+    'Right Stick Click',
+)
+
+_AXIS_NAMES = (
+    'Left Stick X',
+    'Left Stick Y',
+    'Left Trigger (LT)',
+    'Right Stick X',
+    'Right Stick Y',
+    'Right Trigger (RT)',
+    'D-Pad X',
+    'D-Pad Y',
+)
+
+
+# Events fetched per read: 64 events (512 bytes) per syscall instead of
+# one syscall per 8-byte event
+_BATCH_SIZE = _EVENT_SIZE * 64
 
 
 def read_joystick_events(device_path='/dev/input/js0'):
     """
     Read and parse joystick events directly from the device.
-    
+
+    Opens the device nonblocking and waits for readiness in a selector
+    (epoll where available), then drains up to 64 events per os.read so
+    a burst of controller traffic costs one wakeup and one syscall
+    instead of one blocking read per event. The chunk is unpacked with
+    iter_unpack; a read that lands mid-event keeps the tail bytes and
+    completes them from the next chunk.
+
     Args:
         device_path: Path to the joystick device (default: /dev/input/js0)
-    
+
     Yields:
         Tuples of (event_type, number, value, timestamp)
     """
     try:
-        with open(device_path, 'rb') as device:
-            while True:
-                # Read 8 bytes for each event
-                # Format: unsigned int time, short value, unsigned char type, unsigned char number
-                event = device.read(8)
-                if not event:
-                    break
-                    
-                # Unpack the binary data
-                timestamp, value, event_type, number = struct.unpack('IhBB', event)
-                yield (event_type, number, value, timestamp)
-                
-    except IOError as e:
+        fd = os.open(device_path, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError as e:
         print(f"Error reading from {device_path}: {e}")
         return
 
+    sel = selectors.DefaultSelector()
+    sel.register(fd, selectors.EVENT_READ)
+
+    try:
+        pending = b''
+        while True:
+            # Sleep in the kernel until the device has events
+            sel.select()
+            try:
+                chunk = os.read(fd, _BATCH_SIZE)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                break
+            if pending:
+                chunk = pending + chunk
+                pending = b''
+
+            # Keep any partial event for the next read
+            tail = len(chunk) % _EVENT_SIZE
+            if tail:
+                pending = chunk[-tail:]
+                chunk = chunk[:-tail]
+
+            if np is not None:
+                # Zero-copy view of the chunk; the JS_EVENT_INIT filter
+                # runs as one vectorized mask over the whole batch
+                events = np.frombuffer(chunk, _EVENT_DTYPE)
+                events = events[(events['type'] & 0x80) == 0]
+                for timestamp, value, event_type, number in events.tolist():
+                    yield (event_type, number, value, timestamp)
+            else:
+                for timestamp, value, event_type, number in _EVENT_STRUCT.iter_unpack(chunk):
+                    # Drop synthetic initialization events (JS_EVENT_INIT)
+                    # here so consumers never see or re-filter them
+                    if event_type & 0x80:
+                        continue
+                    yield (event_type, number, value, timestamp)
+
+    except IOError as e:
+        print(f"Error reading from {device_path}: {e}")
+    finally:
+        sel.close()
+        os.close(fd)
+
+
+# Axis tuning constants, hoisted so the handlers carry them as default
+# arguments (fast local loads) instead of re-deriving them per event.
+# _TRIGGER_SCALE folds the /65534*100 percentage conversion into one
+# precomputed multiply.
+_JOY_DEADZONE = 3000
+_TRIGGER_REST = -30000
+_TRIGGER_SCALE = 100.0 / 65534.0
+
+
+# Kind codes returned by _classify_axis
+_KIND_NONE = 0
+_KIND_JOY = 1
+_KIND_TRIG = 2
+# Kinds 3-6 are the four d-pad directions, indexing _TAGS directly
+
+_TAGS = (None, None, None,
+         "D-PAD LEFT", "D-PAD RIGHT", "D-PAD UP", "D-PAD DOWN")
+
+
+def _classify_axis(axis_num, value):
+    """
+    Classify an axis event numerically: (kind, scaled value)
+
+    Pure integer/float arithmetic with no string work, so numba can
+    compile it when available; the deadzone and trigger thresholds are
+    frozen in as constants. Formatting happens afterwards in
+    format_axis_value based on the kind code.
+    """
+    if axis_num == 6:  # D-Pad X
+        if value == -32767:
+            return (3, 0.0)
+        if value == 32767:
+            return (4, 0.0)
+        return (0, 0.0)
+    if axis_num == 7:  # D-Pad Y
+        if value == -32767:
+            return (5, 0.0)
+        if value == 32767:
+            return (6, 0.0)
+        return (0, 0.0)
+    if axis_num == 2 or axis_num == 5:  # Triggers
+        if value > _TRIGGER_REST:
+            return (2, (value + 32767) * _TRIGGER_SCALE)
+        return (0, 0.0)
+    # Joysticks - two int comparisons beat an abs() call
+    if value > _JOY_DEADZONE or value < -_JOY_DEADZONE:
+        return (1, 0.0)
+    return (0, 0.0)
+
+
+if njit is not None:
+    _classify_axis = njit(cache=True)(_classify_axis)
+
 
 def format_axis_value(axis_num, value):
     """
     Format axis values for better readability.
-    
+
     Args:
         axis_num: Axis number
         value: Raw axis value
-    
+
     Returns:
         Formatted string or None if value should be ignored
     """
-    # D-Pad handling
-    if axis_num == 6:  # D-Pad X
-        if value == -32767:
-            return "D-PAD LEFT"
-        elif value == 32767:
-            return "D-PAD RIGHT"
-        elif value == 0:
-            return None  # Neutral
-    elif axis_num == 7:  # D-Pad Y
-        if value == -32767:
-            return "D-PAD UP"
-        elif value == 32767:
-            return "D-PAD DOWN"
-        elif value == 0:
-            return None  # Neutral
-    
-    # Trigger handling (LT/RT)
-    elif axis_num in [2, 5]:  # Triggers
-        if value > -30000:  # Ignore small values near minimum
-            trigger_value = (value + 32767) / 65534 * 100  # Convert to percentage
-            return f"{AXIS_NAMES[axis_num]}: {trigger_value:.1f}%"
-    
-    # Joystick handling
-    elif axis_num in [0, 1, 3, 4]:  # Joysticks
-        if abs(value) > 3000:  # Deadzone filtering
-            return f"{AXIS_NAMES[axis_num]}: {value}"
-    
-    return None
+    if axis_num >= len(_AXIS_NAMES):
+        return None
+    kind, scaled = _classify_axis(axis_num, value)
+    if kind == _KIND_NONE:
+        return None
+    if kind == _KIND_JOY:
+        return f"{_AXIS_NAMES[axis_num]}: {value}"
+    if kind == _KIND_TRIG:
+        return f"{_AXIS_NAMES[axis_num]}: {scaled:.1f}%"
+    return _TAGS[kind]
 
 
 def main():
@@ -155,31 +267,46 @@ def main():
     print("Controller device found and accessible!")
     print("Press Ctrl+C to exit.\n")
     print("-" * 60)
-    
+
+    # Formatted lines are collected as bytes and written to the binary
+    # stdout buffer in batches - one write and flush per 16 events or
+    # 50 ms instead of a print per event
+    out = sys.stdout.buffer
+    batch = []
+    last_flush = time.monotonic()
+
     try:
         for event_type, number, value, timestamp in read_joystick_events(device_path):
-            # Filter initialization events (type & 0x80)
-            if event_type & 0x80:
-                continue
-                
             # Button events (type 1)
             if event_type == 1:
-                button_name = BUTTON_NAMES.get(number, f"Button {number}")
+                button_name = (_BUTTON_NAMES[number] if number < len(_BUTTON_NAMES)
+                               else f"Button {number}")
                 action = "PRESSED" if value else "RELEASED"
-                print(f"[BUTTON] {button_name}: {action}")
-            
+                batch.append(f"[BUTTON] {button_name}: {action}\n".encode())
+
             # Axis events (type 2) - joysticks, triggers, d-pad
             elif event_type == 2:
                 formatted_value = format_axis_value(number, value)
                 if formatted_value:
                     if "D-PAD" in formatted_value:
-                        print(f"[D-PAD] {formatted_value}")
+                        batch.append(f"[D-PAD] {formatted_value}\n".encode())
                     elif "Trigger" in formatted_value:
-                        print(f"[TRIGGER] {formatted_value}")
+                        batch.append(f"[TRIGGER] {formatted_value}\n".encode())
                     else:
-                        print(f"[JOYSTICK] {formatted_value}")
-                        
+                        batch.append(f"[JOYSTICK] {formatted_value}\n".encode())
+
+            if batch:
+                now = time.monotonic()
+                if len(batch) >= 16 or now - last_flush >= 0.05:
+                    out.write(b''.join(batch))
+                    out.flush()
+                    batch.clear()
+                    last_flush = now
+
     except KeyboardInterrupt:
+        if batch:
+            out.write(b''.join(batch))
+            out.flush()
         print("\n" + "-" * 60)
         print("Exiting...")
         sys.exit(0)
@@ -5,7 +5,9 @@ StickBot - NVIDIA Orin Nano GPIO Library
 __version__ = "0.1.0"
 __author__ = "Your Name"
 
-from .gpio import DigitalPin, PWMPin
+from .gpio import DigitalPin, PWMPin, PinBank, set_outputs
+from .mmap_gpio import MmapGPIO
 from .utils import setup_gpio, cleanup_gpio
 
-__all__ = ["DigitalPin", "PWMPin", "setup_gpio", "cleanup_gpio"]
\ No newline at end of file
+__all__ = ["DigitalPin", "PWMPin", "PinBank", "MmapGPIO", "set_outputs",
+           "setup_gpio", "cleanup_gpio"]
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Shared GPIO backend resolution for stickbot
+
+The Jetson.GPIO / RPi.GPIO fallback import used to be duplicated in
+every module that touches the backend; resolving it here means the
+try/except dance runs once per process and every stickbot module sees
+the same backend object.
+"""
+
+try:
+    import Jetson.GPIO as GPIO
+except ImportError:
+    try:
+        import RPi.GPIO as GPIO
+    except ImportError:
+        raise ImportError(
+            "Neither Jetson.GPIO nor RPi.GPIO is available. "
+            "Please install the appropriate GPIO library for your platform."
+        )
+
+
+# The numbering mode is process-global and never changes once set, so
+# after the first successful check the getmode round-trip is skipped
+_mode_initialized = False
+
+
+def ensure_mode(desired=GPIO.BOARD):
+    """
+    Make sure the pin numbering mode is set, memoizing the result
+
+    Sets the mode on first use and raises ValueError if it was already
+    set to something else; afterwards the check is a single flag test
+    instead of a GPIO.getmode call per pin construction.
+    """
+    global _mode_initialized
+    if _mode_initialized:
+        return
+    current = GPIO.getmode()
+    if current is None:
+        GPIO.setmode(desired)
+    elif current != desired:
+        raise ValueError("GPIO mode already set to different mode")
+    _mode_initialized = True
@@ -4,16 +4,15 @@ GPIO utilities and wrapper classes for NVIDIA Orin Nano
 import time
 import warnings
 
+from ._gpio_backend import GPIO, ensure_mode
+
+# Optional libgpiod backend: a line read/write through the GPIO character
+# device is a single short ioctl, much cheaper than the sysfs path the
+# default backend may use. Only used when a caller opts in per pin.
 try:
-    import Jetson.GPIO as GPIO
+    import gpiod
 except ImportError:
-    try:
-        import RPi.GPIO as GPIO
-    except ImportError:
-        raise ImportError(
-            "Neither Jetson.GPIO nor RPi.GPIO is available. "
-            "Please install the appropriate GPIO library for your platform."
-        )
+    gpiod = None
 
 
 def setup_gpio():
@@ -36,18 +35,57 @@ class DigitalPin:
         pin_number: GPIO pin number (BOARD numbering)
         direction: GPIO.IN or GPIO.OUT
         initial_value: GPIO.HIGH or GPIO.LOW (for output pins only)
+        gpiod_offset: Optional libgpiod line offset for this pin. When given
+            (and the gpiod module is installed), reads and writes go through
+            the GPIO character device - one short ioctl per operation -
+            instead of the default backend. Line offsets are SoC specific;
+            see /sys/kernel/debug/gpio for the mapping on your board.
+        gpiod_chip: GPIO chip to open for the gpiod backend
     """
-    
-    def __init__(self, pin_number, direction, initial_value=None):
+
+    # Backend constants and calls cached as class attributes: inside the
+    # methods, self._HIGH or self._output resolves through the class dict
+    # instead of a module global plus attribute lookup per access
+    _HIGH = GPIO.HIGH
+    _LOW = GPIO.LOW
+    _OUT = GPIO.OUT
+    _IN = GPIO.IN
+    _BOARD = GPIO.BOARD
+    _output = staticmethod(GPIO.output)
+    _input = staticmethod(GPIO.input)
+
+    def __init__(self, pin_number, direction, initial_value=None,
+                 gpiod_offset=None, gpiod_chip='gpiochip0'):
         self.pin_number = pin_number
         self.direction = direction
-        
-        # Set pin numbering mode
-        if GPIO.getmode() is None:
-            GPIO.setmode(GPIO.BOARD)
-        elif GPIO.getmode() != GPIO.BOARD:
-            raise ValueError("GPIO mode already set to different mode")
-        
+        self._line = None
+
+        if gpiod_offset is not None:
+            if gpiod is None:
+                raise ImportError(
+                    "gpiod is not available. Install libgpiod (python3-libgpiod) "
+                    "to use the character-device backend."
+                )
+            if direction not in (GPIO.IN, GPIO.OUT):
+                raise ValueError("Direction must be GPIO.IN or GPIO.OUT")
+
+            chip = gpiod.Chip(gpiod_chip)
+            self._line = chip.get_line(gpiod_offset)
+            if direction == GPIO.OUT:
+                initial = initial_value if initial_value is not None else GPIO.LOW
+                self._line.request(consumer='stickbot',
+                                   type=gpiod.LINE_REQ_DIR_OUT,
+                                   default_vals=[initial])
+                self._current_value = initial
+            else:
+                self._line.request(consumer='stickbot',
+                                   type=gpiod.LINE_REQ_DIR_IN)
+                self._current_value = None
+            return
+
+        # Set pin numbering mode (memoized after the first pin)
+        ensure_mode()
+
         # Setup the pin
         if direction == GPIO.OUT:
             GPIO.setup(pin_number, GPIO.OUT, initial=initial_value)
@@ -57,50 +95,175 @@ class DigitalPin:
             self._current_value = None
         else:
             raise ValueError("Direction must be GPIO.IN or GPIO.OUT")
-    
+
     def set_high(self):
         """Set output pin to HIGH"""
-        if self.direction != GPIO.OUT:
+        if self.direction != self._OUT:
             raise ValueError("Pin is not configured as output")
-        GPIO.output(self.pin_number, GPIO.HIGH)
-        self._current_value = GPIO.HIGH
-    
+        if self._line is not None:
+            self._line.set_value(1)
+        else:
+            self._output(self.pin_number, self._HIGH)
+        self._current_value = self._HIGH
+
     def set_low(self):
         """Set output pin to LOW"""
-        if self.direction != GPIO.OUT:
+        if self.direction != self._OUT:
             raise ValueError("Pin is not configured as output")
-        GPIO.output(self.pin_number, GPIO.LOW)
-        self._current_value = GPIO.LOW
-    
+        if self._line is not None:
+            self._line.set_value(0)
+        else:
+            self._output(self.pin_number, self._LOW)
+        self._current_value = self._LOW
+
     def toggle(self):
-        """Toggle output pin state"""
-        if self.direction != GPIO.OUT:
+        """Toggle output pin state and return the new value"""
+        if self.direction != self._OUT:
             raise ValueError("Pin is not configured as output")
-        if self._current_value == GPIO.HIGH:
-            self.set_low()
+        # HIGH and LOW are 1 and 0, so the new level is one XOR away -
+        # no branch on the current value and one write straight to the
+        # backend instead of going through set_high/set_low
+        new_value = self._current_value ^ 1
+        if self._line is not None:
+            self._line.set_value(new_value)
         else:
-            self.set_high()
-    
+            self._output(self.pin_number, new_value)
+        self._current_value = new_value
+        return new_value
+
     def read(self):
         """Read current pin value"""
-        value = GPIO.input(self.pin_number)
-        if self.direction == GPIO.IN:
+        if self._line is not None:
+            value = self._line.get_value()
+        else:
+            value = self._input(self.pin_number)
+        if self.direction == self._IN:
             self._current_value = value
         return value
-    
+
     def get_value(self):
-        """Get the last known pin value without reading"""
+        """
+        Get the last known pin value without touching the hardware
+
+        For output pins this is the last written level, so callers that
+        just wrote the pin can query it without a read syscall.
+        """
         return self._current_value
-    
+
     def cleanup(self):
         """Clean up this specific pin"""
-        GPIO.cleanup(self.pin_number)
+        if self._line is not None:
+            self._line.release()
+            self._line = None
+        else:
+            GPIO.cleanup(self.pin_number)
     
     def __str__(self):
-        direction_str = "OUTPUT" if self.direction == GPIO.OUT else "INPUT"
+        direction_str = "OUTPUT" if self.direction == self._OUT else "INPUT"
         return f"DigitalPin(pin={self.pin_number}, direction={direction_str}, value={self._current_value})"
 
 
+def set_outputs(pairs):
+    """
+    Set several DigitalPin outputs with one batched backend call
+
+    Args:
+        pairs: Iterable of (DigitalPin, value) pairs with value
+            GPIO.HIGH or GPIO.LOW
+
+    All pins are written in a single multi-channel GPIO.output call
+    instead of one backend call per pin, then each pin's cached value
+    is updated so get_value stays accurate.
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return
+
+    pins = []
+    values = []
+    for pin, value in pairs:
+        if pin.direction != GPIO.OUT:
+            raise ValueError("Pin is not configured as output")
+        if pin._line is not None:
+            raise ValueError(
+                "set_outputs does not support gpiod-backed pins"
+            )
+        pins.append(pin.pin_number)
+        values.append(value)
+
+    GPIO.output(pins, values)
+    for pin, value in pairs:
+        pin._current_value = value
+
+
+class PinBank:
+    """
+    Packed bank of GPIO pins addressed as one integer bitmask
+
+    Bit i of a mask corresponds to pins[i]. Setup and writes touch the
+    whole bank with a single batched backend call instead of one call per
+    pin, and callers can XOR successive masks to find changed pins.
+    Reads loop over the pins because GPIO.input only accepts a single
+    channel in both backends.
+
+    Args:
+        pins: GPIO pin numbers (BOARD numbering)
+        direction: GPIO.IN or GPIO.OUT (applies to the whole bank)
+        initial_mask: Initial output levels as a bitmask (output banks only)
+    """
+
+    def __init__(self, pins, direction, initial_mask=0):
+        self.pins = list(pins)
+        self.direction = direction
+
+        # Set pin numbering mode (memoized after the first pin)
+        ensure_mode()
+
+        if direction == GPIO.OUT:
+            GPIO.setup(self.pins, GPIO.OUT, initial=GPIO.LOW)
+            self._mask = 0
+            if initial_mask:
+                self.write_all(initial_mask)
+        elif direction == GPIO.IN:
+            GPIO.setup(self.pins, GPIO.IN)
+            self._mask = 0
+        else:
+            raise ValueError("Direction must be GPIO.IN or GPIO.OUT")
+
+    def read_all(self):
+        """Read every pin in the bank and pack the values into a bitmask"""
+        # Unlike setup and output, GPIO.input takes one channel at a time,
+        # so reads are a per-pin loop with the bound method hoisted out
+        read = GPIO.input
+        mask = 0
+        for i, pin in enumerate(self.pins):
+            mask |= read(pin) << i
+        self._mask = mask
+        return mask
+
+    def write_all(self, mask):
+        """Set every pin from a bitmask with one batched call"""
+        if self.direction != GPIO.OUT:
+            raise ValueError("Bank is not configured as output")
+        GPIO.output(self.pins, [(mask >> i) & 1 for i in range(len(self.pins))])
+        self._mask = mask
+
+    def get_mask(self):
+        """Get the last known bank state as a bitmask"""
+        return self._mask
+
+    def cleanup(self):
+        """Clean up every pin in the bank"""
+        GPIO.cleanup(self.pins)
+
+    def __len__(self):
+        return len(self.pins)
+
+    def __str__(self):
+        direction_str = "OUTPUT" if self.direction == GPIO.OUT else "INPUT"
+        return f"PinBank(pins={self.pins}, direction={direction_str}, mask={self._mask:#b})"
+
+
 class PWMPin:
     """
     PWM wrapper for hardware PWM pins
@@ -110,17 +273,20 @@ class PWMPin:
         frequency: PWM frequency in Hz
     """
     
+    # Backend constants cached as class attributes, same as DigitalPin
+    _HIGH = GPIO.HIGH
+    _LOW = GPIO.LOW
+    _OUT = GPIO.OUT
+    _BOARD = GPIO.BOARD
+
     def __init__(self, pin_number, frequency=1000):
         self.pin_number = pin_number
         self.frequency = frequency
         self._duty_cycle = 0
         self._started = False
         
-        # Set pin numbering mode
-        if GPIO.getmode() is None:
-            GPIO.setmode(GPIO.BOARD)
-        elif GPIO.getmode() != GPIO.BOARD:
-            raise ValueError("GPIO mode already set to different mode")
+        # Set pin numbering mode (memoized after the first pin)
+        ensure_mode()
         
         # Setup pin as output
         GPIO.setup(pin_number, GPIO.OUT, initial=GPIO.LOW)
@@ -4,16 +4,7 @@ Utility functions for StickBot GPIO operations
 import time
 import sys
 
-try:
-    import Jetson.GPIO as GPIO
-except ImportError:
-    try:
-        import RPi.GPIO as GPIO
-    except ImportError:
-        raise ImportError(
-            "Neither Jetson.GPIO nor RPi.GPIO is available. "
-            "Please install the appropriate GPIO library for your platform."
-        )
+from ._gpio_backend import GPIO
 
 
 def setup_gpio():
@@ -60,9 +51,24 @@ def blink_led(pin, duration=1.0, times=5):
     """
     if GPIO.getmode() is None:
         GPIO.setmode(GPIO.BOARD)
-    
+
     GPIO.setup(pin, GPIO.OUT, initial=GPIO.LOW)
-    
+
+    # A blink is a square wave at 50% duty, which is exactly what the
+    # PWM engine generates: on PWM-capable pins the whole blink costs
+    # one sleep instead of a Python wakeup per edge
+    if pin in get_available_pins()['pwm_capable']:
+        try:
+            pwm = GPIO.PWM(pin, 1.0 / duration)
+            pwm.start(50)
+            time.sleep(times * duration)
+            pwm.stop()
+            GPIO.output(pin, GPIO.LOW)
+            print(f"Blinked pin {pin} {times} times (hardware PWM)")
+            return
+        except Exception:
+            pass  # PWM unavailable (e.g. pinmux not set) - use the loop
+
     try:
         for i in range(times):
             GPIO.output(pin, GPIO.HIGH)
@@ -94,47 +100,56 @@ def read_pin_state(pin):
     return state
 
 
+# Per-board pin tables built once at import. The pin data is static, so
+# get_available_pins becomes a single dict lookup instead of rebuilding
+# nested dicts and lists on every call; tuples keep the entries from
+# being mutated by callers.
+_HEADER_40_DIGITAL = (7, 11, 12, 13, 15, 16, 18, 19, 21, 22, 23, 24,
+                      26, 29, 31, 32, 33, 35, 36, 37, 38, 40)
+
+_BOARD_PINS = {
+    'JETSON_ORIN_NANO': {
+        'digital': _HEADER_40_DIGITAL,
+        'pwm_capable': (15, 33),  # Hardware PWM pins
+        'notes': {
+            15: 'PWM capable - may need pinmux configuration',
+            33: 'PWM capable - may need pinmux configuration',
+            36: 'May be input-only depending on base board'
+        }
+    },
+    'JETSON_ORIN_NX': {
+        'digital': _HEADER_40_DIGITAL,
+        'pwm_capable': (15, 33),
+        'notes': {
+            15: 'PWM capable - may need pinmux configuration',
+            33: 'PWM capable - may need pinmux configuration'
+        }
+    },
+    'JETSON_ORIN': {
+        'digital': _HEADER_40_DIGITAL,
+        'pwm_capable': (15, 18),
+        'notes': {
+            15: 'PWM capable - may need pinmux configuration',
+            18: 'PWM capable - may need pinmux configuration'
+        }
+    }
+}
+
+_DEFAULT_BOARD = {
+    'digital': _HEADER_40_DIGITAL,
+    'pwm_capable': (),
+    'notes': {'unknown': 'Unknown board model - assuming 40-pin header layout'}
+}
+
+
 def get_available_pins():
     """
-    Return a list of available GPIO pins for the current board
-    
+    Return the available GPIO pins for the current board
+
     Returns:
         Dictionary with pin information
     """
-    board_pins = {
-        'JETSON_ORIN_NANO': {
-            'digital': [7, 11, 12, 13, 15, 16, 18, 19, 21, 22, 23, 24, 26, 29, 31, 32, 33, 35, 36, 37, 38, 40],
-            'pwm_capable': [15, 33],  # Hardware PWM pins
-            'notes': {
-                15: 'PWM capable - may need pinmux configuration',
-                33: 'PWM capable - may need pinmux configuration',
-                36: 'May be input-only depending on base board'
-            }
-        },
-        'JETSON_ORIN_NX': {
-            'digital': [7, 11, 12, 13, 15, 16, 18, 19, 21, 22, 23, 24, 26, 29, 31, 32, 33, 35, 36, 37, 38, 40],
-            'pwm_capable': [15, 33],
-            'notes': {
-                15: 'PWM capable - may need pinmux configuration',
-                33: 'PWM capable - may need pinmux configuration'
-            }
-        },
-        'JETSON_ORIN': {
-            'digital': [7, 11, 12, 13, 15, 16, 18, 19, 21, 22, 23, 24, 26, 29, 31, 32, 33, 35, 36, 37, 38, 40],
-            'pwm_capable': [15, 18],
-            'notes': {
-                15: 'PWM capable - may need pinmux configuration',
-                18: 'PWM capable - may need pinmux configuration'
-            }
-        }
-    }
-    
-    model = GPIO.model
-    return board_pins.get(model, {
-        'digital': [7, 11, 12, 13, 15, 16, 18, 19, 21, 22, 23, 24, 26, 29, 31, 32, 33, 35, 36, 37, 38, 40],
-        'pwm_capable': [],
-        'notes': {'unknown': f'Unknown board model: {model}'}
-    })
+    return _BOARD_PINS.get(GPIO.model, _DEFAULT_BOARD)
 
 
 def print_board_info():
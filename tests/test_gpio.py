@@ -1,5 +1,6 @@
+import importlib
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, call, patch, MagicMock
 import sys
 import os
 
@@ -7,6 +8,22 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 
+def _reload_stickbot():
+    """
+    Re-import the stickbot modules against the currently patched backend
+
+    The backend is resolved once in stickbot._gpio_backend and cached on
+    the pin classes at class-creation time, so each test reloads the
+    chain to bind everything to its own mock.
+    """
+    import stickbot._gpio_backend
+    import stickbot.gpio
+    import stickbot.utils
+    importlib.reload(stickbot._gpio_backend)
+    importlib.reload(stickbot.gpio)
+    importlib.reload(stickbot.utils)
+
+
 class TestGPIOClasses(unittest.TestCase):
     """Test GPIO wrapper classes"""
     
@@ -26,14 +43,21 @@ class TestGPIOClasses(unittest.TestCase):
         
         # Mock getmode to return None initially
         self.mock_jetson_gpio.getmode.return_value = None
-        
-        # Patch the imports
-        self.jetson_patcher = patch.dict('sys.modules', {'Jetson.GPIO': self.mock_jetson_gpio})
+
+        # Patch the imports. `import Jetson.GPIO` needs the parent
+        # package in sys.modules too, with GPIO reachable as an attribute
+        jetson_pkg = MagicMock()
+        jetson_pkg.GPIO = self.mock_jetson_gpio
+        self.jetson_patcher = patch.dict('sys.modules', {
+            'Jetson': jetson_pkg,
+            'Jetson.GPIO': self.mock_jetson_gpio,
+        })
         self.rpi_patcher = patch.dict('sys.modules', {'RPi.GPIO': self.mock_rpi_gpio})
-        
+
         self.jetson_patcher.start()
         self.rpi_patcher.start()
-    
+        _reload_stickbot()
+
     def tearDown(self):
         """Cleanup patches"""
         self.jetson_patcher.stop()
@@ -131,6 +155,55 @@ class TestGPIOClasses(unittest.TestCase):
         with self.assertRaises(ValueError):
             pin.toggle()
     
+    def test_pin_bank_read_all(self):
+        """Test reading a PinBank as a packed bitmask"""
+        from stickbot.gpio import PinBank
+
+        bank = PinBank([16, 18, 22], self.mock_jetson_gpio.IN)
+
+        # One read per pin: pins 16 and 22 HIGH, pin 18 LOW
+        self.mock_jetson_gpio.input.side_effect = [1, 0, 1]
+
+        mask = bank.read_all()
+        self.mock_jetson_gpio.input.assert_has_calls(
+            [call(16), call(18), call(22)])
+        self.assertEqual(mask, 0b101)
+        self.assertEqual(bank.get_mask(), 0b101)
+
+    def test_pin_bank_write_all(self):
+        """Test writing a PinBank from a packed bitmask"""
+        from stickbot.gpio import PinBank
+
+        bank = PinBank([16, 18, 22], self.mock_jetson_gpio.OUT)
+
+        bank.write_all(0b011)
+        self.mock_jetson_gpio.output.assert_called_with([16, 18, 22], [1, 1, 0])
+        self.assertEqual(bank.get_mask(), 0b011)
+
+        # Input banks must reject writes
+        input_bank = PinBank([16], self.mock_jetson_gpio.IN)
+        with self.assertRaises(ValueError):
+            input_bank.write_all(0b1)
+
+    def test_set_outputs(self):
+        """Test writing several pins with one batched call"""
+        from stickbot.gpio import DigitalPin, set_outputs
+
+        pin_a = DigitalPin(16, self.mock_jetson_gpio.OUT, self.mock_jetson_gpio.LOW)
+        pin_b = DigitalPin(18, self.mock_jetson_gpio.OUT, self.mock_jetson_gpio.LOW)
+
+        set_outputs([(pin_a, self.mock_jetson_gpio.HIGH),
+                     (pin_b, self.mock_jetson_gpio.LOW)])
+
+        self.mock_jetson_gpio.output.assert_called_with([16, 18], [1, 0])
+        self.assertEqual(pin_a.get_value(), self.mock_jetson_gpio.HIGH)
+        self.assertEqual(pin_b.get_value(), self.mock_jetson_gpio.LOW)
+
+        # Input pins must be rejected
+        input_pin = DigitalPin(22, self.mock_jetson_gpio.IN)
+        with self.assertRaises(ValueError):
+            set_outputs([(input_pin, self.mock_jetson_gpio.HIGH)])
+
     def test_pwm_pin_creation(self):
         """Test creating a PWMPin"""
         from stickbot.gpio import PWMPin
@@ -237,9 +310,15 @@ class TestUtilityFunctions(unittest.TestCase):
         self.mock_gpio.LOW = 0
         self.mock_gpio.model = "JETSON_ORIN_NANO"
         
-        self.patcher = patch.dict('sys.modules', {'Jetson.GPIO': self.mock_gpio})
+        jetson_pkg = MagicMock()
+        jetson_pkg.GPIO = self.mock_gpio
+        self.patcher = patch.dict('sys.modules', {
+            'Jetson': jetson_pkg,
+            'Jetson.GPIO': self.mock_gpio,
+        })
         self.patcher.start()
-    
+        _reload_stickbot()
+
     def tearDown(self):
         """Cleanup patches"""
         self.patcher.stop()